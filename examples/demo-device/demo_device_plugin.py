@@ -8,7 +8,7 @@ from serial_mcp_server.handlers_serial import (
     handle_read_until,
     handle_write,
 )
-from serial_mcp_server.helpers import _ok
+from serial_mcp_server.helpers import _err, _ok
 from serial_mcp_server.state import SerialState
 
 META = {
@@ -42,6 +42,38 @@ async def _send_cmd(state: SerialState, connection_id: str, cmd: str, timeout_ms
     return text.strip()
 
 
+async def _send_cmd_batch(
+    state: SerialState, connection_id: str, cmds: list[str], timeout_ms: int = 2000
+) -> list[str]:
+    """Send several commands in one write, then read one '> ' prompt per command.
+
+    Returns the response text for each command, in order (without prompts).
+    """
+    await handle_write(
+        state,
+        {
+            "connection_id": connection_id,
+            "data": "\n".join(cmds),
+            "append_newline": True,
+        },
+    )
+    results = []
+    for _ in cmds:
+        resp = await handle_read_until(
+            state,
+            {
+                "connection_id": connection_id,
+                "delimiter": "> ",
+                "timeout_ms": timeout_ms,
+            },
+        )
+        text = resp.get("data", "")
+        if text.endswith("> "):
+            text = text[:-2]
+        results.append(text.strip())
+    return results
+
+
 # ---------------------------------------------------------------------------
 # Tools
 # ---------------------------------------------------------------------------
@@ -58,6 +90,26 @@ TOOLS = [
             "required": ["connection_id"],
         },
     ),
+    Tool(
+        name="demo.batch",
+        description=(
+            "Run several device commands in one round trip. Commands are written together "
+            "and one response is returned per command, in order. 'sample' and 'reboot' are "
+            "rejected — they do not answer with a single prompt."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "connection_id": {"type": "string"},
+                "commands": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": 'Raw device commands, e.g. ["version", "uptime", "status"].',
+                },
+            },
+            "required": ["connection_id", "commands"],
+        },
+    ),
     Tool(
         name="demo.status",
         description="Get device status (state, temp, uptime, logs_enabled, authenticated) as JSON.",
@@ -216,8 +268,33 @@ async def handle_version(state: SerialState, args: dict) -> dict:
     return _ok(version=text)
 
 
+# Commands that stream extra output or a different number of prompts.
+_UNBATCHABLE_COMMANDS = frozenset({"sample", "reboot"})
+
+
+async def handle_batch(state: SerialState, args: dict) -> dict:
+    cmds = args.get("commands")
+    # Commands are joined with newlines into one write, so each must be a single line.
+    if not isinstance(cmds, list) or not all(
+        isinstance(c, str) and "\n" not in c and "\r" not in c for c in cmds
+    ):
+        return _err("invalid_params", "commands must be a list of single-line strings")
+    # _send_cmd_batch pairs replies with commands by counting prompts, which these break.
+    for c in cmds:
+        words = c.split(None, 1)
+        if words and words[0].lower() in _UNBATCHABLE_COMMANDS:
+            return _err("invalid_params", f"'{words[0]}' cannot be batched; call it on its own.")
+    if not cmds:
+        return _ok(results=[])
+    results = await _send_cmd_batch(state, args["connection_id"], cmds)
+    return _ok(results=results)
+
+
 async def handle_status(state: SerialState, args: dict) -> dict:
     text = await _send_cmd(state, args["connection_id"], "status")
+    # Error replies ("ERROR: ...") are plain text; only hand JSON objects to the parser.
+    if not text.startswith("{"):
+        return _ok(raw=text)
     try:
         data = json.loads(text)
         return _ok(**data)
@@ -244,6 +321,8 @@ async def handle_config_get(state: SerialState, args: dict) -> dict:
     key = args.get("key", "")
     cmd = f"config get {key}".strip()
     text = await _send_cmd(state, args["connection_id"], cmd)
+    if not text.startswith(("{", "[")):
+        return _ok(raw=text)
     try:
         data = json.loads(text)
         if isinstance(data, dict):
@@ -293,6 +372,7 @@ async def handle_reboot(state: SerialState, args: dict) -> dict:
 
 HANDLERS = {
     "demo.version": handle_version,
+    "demo.batch": handle_batch,
     "demo.status": handle_status,
     "demo.ping": handle_ping,
     "demo.echo": handle_echo,
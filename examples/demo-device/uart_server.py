@@ -15,6 +15,7 @@ from __future__ import annotations
 import argparse
 import json
 import random
+import re
 import time
 
 import serial
@@ -38,13 +39,48 @@ CONFIG_VALIDATORS: dict[str, tuple[type, int | None, int | None]] = {
     "device_name": (str, None, None),
 }
 
+# Accept \r\n, \n, or bare \r as line terminators (earliest match wins).
+_LINE_RE = re.compile(rb"\r\n|\n|\r")
+_BUF_COMPACT_THRESHOLD = 4096
+
+# Output lines emitted on every log/sample tick, formatted without rebuilding an f-string.
+_LOG_FMT = "[LOG] {ts} temp={t:.1f} humidity={h:.1f} pressure={p:.1f}".format
+_SAMPLE_FMT = "[SAMPLE] {n}/{total} temp={t:.1f} humidity={h:.1f}".format
+
+_rng = random.Random()
+
+# Multi-line responses, pre-encoded with their trailing prompt so each goes out in one write.
+_HELP_BYTES = (
+    b"Available commands:\r\n"
+    b"  help                 Show this help message\r\n"
+    b"  version              Show firmware version\r\n"
+    b"  uptime               Show device uptime\r\n"
+    b"  ping                 Respond with 'pong'\r\n"
+    b"  echo <text>          Echo text back\r\n"
+    b"  status               Show device status (JSON)\r\n"
+    b"  config get [key]     Get configuration\r\n"
+    b"  config set <k> <v>   Set configuration value\r\n"
+    b"  log start [ms]       Start periodic logging\r\n"
+    b"  log stop             Stop logging\r\n"
+    b"  sample <count>       Collect sensor samples\r\n"
+    b"  auth <password>      Authenticate for privileged commands\r\n"
+    b"  secret               Show secret (requires auth)\r\n"
+    b"  factory-reset        Factory reset (requires auth)\r\n"
+    b"  reboot               Reboot device\r\n"
+    b"> "
+)
+_BOOT_BYTES = f"[BOOT] DemoDevice v{VERSION}\r\n[BOOT] Ready.\r\n> ".encode()
+
 
 class DemoDevice:
     """Simulated serial device with a CLI command interface."""
 
     def __init__(self, send_fn):
-        self._send = send_fn
-        self._buf = b""
+        self._send_fn = send_fn
+        # While a command or tick is running, output collects here and goes out in one write.
+        self._out_frame: bytearray | None = None
+        self._buf = bytearray()
+        self._buf_head = 0
         self._authenticated = False
         self._logging = False
         self._last_log_ts = 0.0
@@ -54,9 +90,32 @@ class DemoDevice:
         self._last_sample_ts = 0.0
         self._start_time = time.time()
         self._config = dict(DEFAULT_CONFIG)
+        # Tick intervals in seconds, refreshed whenever logging/sampling starts or config changes.
+        self._log_interval_s = self._config["log_interval_ms"] / 1000.0
+        self._sample_interval_s = 1.0 / self._config["sample_rate_hz"]
+        self._last_strftime_sec = -1
+        self._last_strftime_str = ""
 
     # -- I/O helpers --------------------------------------------------------
 
+    def _send(self, data: bytes) -> None:
+        if self._out_frame is not None:
+            self._out_frame += data
+        else:
+            self._send_fn(data)
+
+    def _begin_frame(self) -> None:
+        self._out_frame = bytearray()
+
+    def _flush_frame(self) -> None:
+        if self._out_frame:
+            self._send_fn(bytes(self._out_frame))
+            self._out_frame.clear()
+
+    def _end_frame(self) -> None:
+        self._flush_frame()
+        self._out_frame = None
+
     def _write(self, text: str) -> None:
         self._send((text + "\r\n").encode())
 
@@ -66,77 +125,96 @@ class DemoDevice:
     # -- Public interface ---------------------------------------------------
 
     def boot(self) -> None:
-        self._write(f"[BOOT] DemoDevice v{VERSION}")
-        self._write("[BOOT] Ready.")
-        self._prompt()
+        self._send(_BOOT_BYTES)
 
     def feed(self, data: bytes) -> None:
         """Feed raw bytes from the serial port. Buffers until a line terminator."""
-        self._buf += data
+        self._buf.extend(data)
         while True:
-            # Accept \r\n, \n, or bare \r as line terminators.
-            idx_rn = self._buf.find(b"\r\n")
-            idx_n = self._buf.find(b"\n")
-            idx_r = self._buf.find(b"\r")
-
-            candidates = []
-            if idx_rn != -1:
-                candidates.append((idx_rn, 2))
-            if idx_n != -1 and (idx_rn == -1 or idx_n < idx_rn):
-                candidates.append((idx_n, 1))
-            if idx_r != -1 and idx_rn != idx_r and (idx_rn == -1 or idx_r < idx_rn):
-                candidates.append((idx_r, 1))
-
-            if not candidates:
+            m = _LINE_RE.search(self._buf, self._buf_head)
+            if m is None:
                 break
 
-            idx, sep_len = min(candidates, key=lambda c: c[0])
+            idx, end = m.start(), m.end()
             # If we found a bare \r and the next byte could be \n, wait for more data.
-            if sep_len == 1 and self._buf[idx : idx + 1] == b"\r" and idx + 1 == len(self._buf):
+            if m.group() == b"\r" and end == len(self._buf):
                 break
 
-            line = self._buf[:idx].decode(errors="replace").strip()
-            self._buf = self._buf[idx + sep_len :]
+            line = self._buf[self._buf_head : idx].decode(errors="replace").strip()
+            self._buf_head = end
 
             if line:
                 self._handle_command(line)
             else:
                 self._prompt()
 
-    def tick(self) -> None:
-        """Called periodically from the main loop."""
-        now = time.time()
+        # Consumed bytes stay in place until the buffer drains or enough accumulate
+        # to be worth compacting, so a burst of lines costs one memmove, not one per line.
+        if self._buf_head == len(self._buf) or self._buf_head > _BUF_COMPACT_THRESHOLD:
+            del self._buf[: self._buf_head]
+            self._buf_head = 0
 
+    def next_tick_delay(self) -> float | None:
+        """Seconds until ``tick()`` has output due, or None when nothing is scheduled."""
+        deadlines = []
         if self._logging:
-            interval = self._config["log_interval_ms"] / 1000.0
-            if now - self._last_log_ts >= interval:
-                self._last_log_ts = now
-                self._emit_log()
-
+            deadlines.append(self._last_log_ts + self._log_interval_s)
         if self._sampling and self._samples_sent < self._sample_count:
-            interval = 1.0 / self._config["sample_rate_hz"]
-            if now - self._last_sample_ts >= interval:
-                self._last_sample_ts = now
-                self._samples_sent += 1
-                temp = 42.0 + random.uniform(-0.5, 0.5)
-                humidity = 65.0 + random.uniform(-1.0, 1.0)
-                self._write(
-                    f"[SAMPLE] {self._samples_sent}/{self._sample_count} "
-                    f"temp={temp:.1f} humidity={humidity:.1f}"
+            deadlines.append(self._last_sample_ts + self._sample_interval_s)
+        if not deadlines:
+            return None
+        return min(deadlines) - time.time()
+
+    def tick(self) -> None:
+        """Called periodically from the main loop."""
+        now = time.time()
+        self._begin_frame()
+        try:
+            self._tick(now)
+        finally:
+            self._end_frame()
+
+    def _tick(self, now: float) -> None:
+        if self._logging and now - self._last_log_ts >= self._log_interval_s:
+            self._last_log_ts = now
+            self._emit_log(now)
+
+        if (
+            self._sampling
+            and self._samples_sent < self._sample_count
+            and now - self._last_sample_ts >= self._sample_interval_s
+        ):
+            self._last_sample_ts = now
+            self._samples_sent += 1
+            self._write(
+                _SAMPLE_FMT(
+                    n=self._samples_sent,
+                    total=self._sample_count,
+                    t=42.0 + _rng.uniform(-0.5, 0.5),
+                    h=65.0 + _rng.uniform(-1.0, 1.0),
                 )
-                if self._samples_sent >= self._sample_count:
-                    self._sampling = False
-                    self._write("[SAMPLE] DONE")
-                    self._prompt()
+            )
+            if self._samples_sent >= self._sample_count:
+                self._sampling = False
+                self._write("[SAMPLE] DONE")
+                self._prompt()
 
     # -- Sensor simulation --------------------------------------------------
 
-    def _emit_log(self) -> None:
-        ts = time.strftime("%H:%M:%S")
-        temp = 42.0 + random.uniform(-0.5, 0.5)
-        humidity = 65.0 + random.uniform(-1.0, 1.0)
-        pressure = 1013.0 + random.uniform(-0.5, 0.5)
-        self._write(f"[LOG] {ts} temp={temp:.1f} humidity={humidity:.1f} pressure={pressure:.1f}")
+    def _emit_log(self, now: float) -> None:
+        # The timestamp only has second resolution, so format it at most once per second.
+        sec = int(now)
+        if sec != self._last_strftime_sec:
+            self._last_strftime_sec = sec
+            self._last_strftime_str = time.strftime("%H:%M:%S", time.localtime(now))
+        self._write(
+            _LOG_FMT(
+                ts=self._last_strftime_str,
+                t=42.0 + _rng.uniform(-0.5, 0.5),
+                h=65.0 + _rng.uniform(-1.0, 1.0),
+                p=1013.0 + _rng.uniform(-0.5, 0.5),
+            )
+        )
 
     # -- Command dispatch ---------------------------------------------------
 
@@ -145,49 +223,48 @@ class DemoDevice:
         cmd = parts[0].lower()
         rest = parts[1] if len(parts) > 1 else ""
 
-        commands = {
-            "help": self._cmd_help,
-            "version": self._cmd_version,
-            "uptime": self._cmd_uptime,
-            "ping": self._cmd_ping,
-            "echo": self._cmd_echo,
-            "status": self._cmd_status,
-            "config": self._cmd_config,
-            "log": self._cmd_log,
-            "sample": self._cmd_sample,
-            "auth": self._cmd_auth,
-            "secret": self._cmd_secret,
-            "factory-reset": self._cmd_factory_reset,
-            "reboot": self._cmd_reboot,
-        }
-
-        handler = commands.get(cmd)
-        if handler:
-            handler(rest)
-        else:
-            self._write(f"ERROR: unknown command '{cmd}'. Type 'help' for available commands.")
-            self._prompt()
+        self._begin_frame()
+        try:
+            self._dispatch(cmd, rest)
+        finally:
+            self._end_frame()
+
+    def _dispatch(self, cmd: str, rest: str) -> None:
+        match cmd:
+            case "help":
+                self._cmd_help(rest)
+            case "version":
+                self._cmd_version(rest)
+            case "uptime":
+                self._cmd_uptime(rest)
+            case "ping":
+                self._cmd_ping(rest)
+            case "echo":
+                self._cmd_echo(rest)
+            case "status":
+                self._cmd_status(rest)
+            case "config":
+                self._cmd_config(rest)
+            case "log":
+                self._cmd_log(rest)
+            case "sample":
+                self._cmd_sample(rest)
+            case "auth":
+                self._cmd_auth(rest)
+            case "secret":
+                self._cmd_secret(rest)
+            case "factory-reset":
+                self._cmd_factory_reset(rest)
+            case "reboot":
+                self._cmd_reboot(rest)
+            case _:
+                self._write(f"ERROR: unknown command '{cmd}'. Type 'help' for available commands.")
+                self._prompt()
 
     # -- Command implementations --------------------------------------------
 
     def _cmd_help(self, _args: str) -> None:
-        self._write("Available commands:")
-        self._write("  help                 Show this help message")
-        self._write("  version              Show firmware version")
-        self._write("  uptime               Show device uptime")
-        self._write("  ping                 Respond with 'pong'")
-        self._write("  echo <text>          Echo text back")
-        self._write("  status               Show device status (JSON)")
-        self._write("  config get [key]     Get configuration")
-        self._write("  config set <k> <v>   Set configuration value")
-        self._write("  log start [ms]       Start periodic logging")
-        self._write("  log stop             Stop logging")
-        self._write("  sample <count>       Collect sensor samples")
-        self._write("  auth <password>      Authenticate for privileged commands")
-        self._write("  secret               Show secret (requires auth)")
-        self._write("  factory-reset        Factory reset (requires auth)")
-        self._write("  reboot               Reboot device")
-        self._prompt()
+        self._send(_HELP_BYTES)
 
     def _cmd_version(self, _args: str) -> None:
         self._write(f"DemoDevice v{VERSION}")
@@ -206,14 +283,15 @@ class DemoDevice:
         self._prompt()
 
     def _cmd_status(self, _args: str) -> None:
-        status = {
-            "state": "sampling" if self._sampling else ("logging" if self._logging else "idle"),
-            "temp": round(42.0 + random.uniform(-0.5, 0.5), 1),
-            "uptime": int(time.time() - self._start_time),
-            "logs_enabled": self._logging,
-            "authenticated": self._authenticated,
-        }
-        self._write(json.dumps(status))
+        # Fixed schema, so build the JSON directly (same layout json.dumps would produce).
+        state = "sampling" if self._sampling else ("logging" if self._logging else "idle")
+        temp = 42.0 + _rng.uniform(-0.5, 0.5)
+        uptime = int(time.time() - self._start_time)
+        self._write(
+            f'{{"state": "{state}", "temp": {temp:.1f}, "uptime": {uptime}, '
+            f'"logs_enabled": {str(self._logging).lower()}, '
+            f'"authenticated": {str(self._authenticated).lower()}}}'
+        )
         self._prompt()
 
     def _cmd_config(self, args: str) -> None:
@@ -266,6 +344,10 @@ class DemoDevice:
                 return
 
             self._config[key] = value
+            if key == "log_interval_ms":
+                self._log_interval_s = value / 1000.0
+            elif key == "sample_rate_hz":
+                self._sample_interval_s = 1.0 / value
             self._write(f"OK {key}={value}")
             self._prompt()
 
@@ -297,6 +379,7 @@ class DemoDevice:
                     self._prompt()
                     return
             self._logging = True
+            self._log_interval_s = self._config["log_interval_ms"] / 1000.0
             self._last_log_ts = time.time()
             self._write(f"OK logs started (interval={self._config['log_interval_ms']}ms)")
             self._prompt()
@@ -328,6 +411,7 @@ class DemoDevice:
             return
 
         self._sampling = True
+        self._sample_interval_s = 1.0 / self._config["sample_rate_hz"]
         self._sample_count = count
         self._samples_sent = 0
         self._last_sample_ts = time.time()
@@ -373,6 +457,7 @@ class DemoDevice:
         self._authenticated = False
         self._start_time = time.time()
         # Flush "Rebooting..." before the pause.
+        self._flush_frame()
         time.sleep(1)
         self.boot()
 
@@ -401,10 +486,16 @@ def main() -> None:
 
     try:
         while True:
+            # Block in read() until input arrives or the next log/sample line is
+            # due; block indefinitely when the device has nothing scheduled.
+            delay = device.next_tick_delay()
+            if delay is not None and delay <= 0:
+                device.tick()
+                continue
+            ser.timeout = delay
             data = ser.read(ser.in_waiting or 1)
             if data:
                 device.feed(data)
-            device.tick()
     except KeyboardInterrupt:
         print("\nShutting down.")
     finally:
@@ -6,14 +6,14 @@ from typing import Any
 
 from mcp.types import Tool
 
-from serial_mcp_server.helpers import _ok
-from serial_mcp_server.state import SerialState
+from serial_mcp_server.helpers import ToolHandler, _ok
+from serial_mcp_server.state import SerialConnection, SerialState
 
 # ---------------------------------------------------------------------------
 # Tool definitions
 # ---------------------------------------------------------------------------
 
-TOOLS: list[Tool] = [
+TOOLS: tuple[Tool, ...] = (
     Tool(
         name="serial.connections.list",
         description=(
@@ -26,38 +26,41 @@ TOOLS: list[Tool] = [
             "required": [],
         },
     ),
-]
+)
 
 # ---------------------------------------------------------------------------
 # Handlers
 # ---------------------------------------------------------------------------
 
 
+def _connection_entry(conn: SerialConnection) -> dict[str, Any]:
+    entry: dict[str, Any] = {
+        "connection_id": conn.connection_id,
+        "port": conn.port,
+        "is_open": conn.ser.is_open,
+        "baudrate": conn.baudrate,
+        "encoding": conn.encoding,
+        "opened_at": conn.opened_at,
+        "last_seen_ts": conn.last_seen_ts,
+        "buffered_bytes": conn.buffer.available,
+    }
+    if conn.reader is not None:
+        mirror = conn.reader.mirror_info()
+        if mirror is not None:
+            entry["mirror"] = mirror
+    return entry
+
+
 async def handle_connections_list(state: SerialState, _args: dict[str, Any]) -> dict[str, Any]:
-    items: list[dict[str, Any]] = []
-    for conn in state.connections.values():
-        entry: dict[str, Any] = {
-            "connection_id": conn.connection_id,
-            "port": conn.port,
-            "is_open": conn.ser.is_open,
-            "baudrate": conn.baudrate,
-            "encoding": conn.encoding,
-            "opened_at": conn.opened_at,
-            "last_seen_ts": conn.last_seen_ts,
-            "buffered_bytes": conn.buffer.available,
-        }
-        if conn.reader is not None:
-            mirror = conn.reader.mirror_info()
-            if mirror is not None:
-                entry["mirror"] = mirror
-        items.append(entry)
+    items = [_connection_entry(conn) for conn in state.connections.values()]
+    n = len(items)
     return _ok(
-        message=f"{len(items)} connection(s).",
+        message=f"{n} connection(s).",
         connections=items,
-        count=len(items),
+        count=n,
     )
 
 
-HANDLERS: dict[str, Any] = {
+HANDLERS: dict[str, ToolHandler] = {
     "serial.connections.list": handle_connections_list,
 }
@@ -6,22 +6,44 @@ closures that capture them.
 
 from __future__ import annotations
 
-import re
-from pathlib import Path
-from typing import Any
+import string
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, Any
 
-from mcp.server import Server
 from mcp.types import Tool
 
 from serial_mcp_server.helpers import _err, _ok
-from serial_mcp_server.plugins import PluginManager
-from serial_mcp_server.state import SerialState
+
+if TYPE_CHECKING:
+    # Annotation-only; importing state eagerly would pull in pyserial just to
+    # build the static TOOLS list.
+    from pathlib import Path
+
+    from mcp.server import Server
+
+    from serial_mcp_server.plugins import PluginManager
+    from serial_mcp_server.state import SerialState
+
+
+class _SlugTable(dict[int, int]):
+    """``str.translate`` table: ``[a-z0-9]`` map to themselves, everything else to ``_``."""
+
+    def __missing__(self, codepoint: int) -> int:
+        return ord("_")
+
+
+_SLUG_TABLE = _SlugTable({ord(c): ord(c) for c in string.ascii_lowercase + string.digits})
+
+
+def _slugify(name: str) -> str:
+    """Lowercase *name* and collapse non-alphanumeric runs to ``_``."""
+    return "_".join(filter(None, name.lower().translate(_SLUG_TABLE).split("_")))
 
 
-def _plugin_template(device_name: str | None = None) -> str:
-    name = device_name or "my_device"
-    slug = re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
-    return f'''"""Plugin for {name}."""
+_PLUGIN_TEMPLATE = string.Template(
+    '''"""Plugin for $name."""
+
+from typing import Final
 
 from mcp.types import Tool
 
@@ -40,204 +62,271 @@ from serial_mcp_server.handlers_serial import (
 
 # Optional metadata — helps the agent match this plugin to a device.
 # All fields are optional. Use what makes sense for your device.
-META = {{
-    "description": "{name} plugin",
-    # "device_name_contains": "{name}",
-}}
+META: Final = {
+    "description": "$name plugin",
+    # "device_name_contains": "$name",
+}
 
-TOOLS = [
+# TOOLS may be a tuple or a list; nothing mutates it after import.
+TOOLS: Final = (
     Tool(
-        name="{slug}.example",
+        name="$slug.example",
         description="Example tool — replace with real functionality.",
-        inputSchema={{
+        inputSchema={
             "type": "object",
-            "properties": {{
-                "connection_id": {{"type": "string"}},
-            }},
+            "properties": {
+                "connection_id": {"type": "string"},
+            },
             "required": ["connection_id"],
-        }},
+        },
     ),
-]
+)
 
 
 async def handle_example(state: SerialState, args: dict) -> dict:
     connection_id = args["connection_id"]
     # Send a command using handle_write + handle_read_until:
-    #   await handle_write(state, {{
+    #   await handle_write(state, {
     #       "connection_id": connection_id,
     #       "data": "COMMAND",
     #       "append_newline": True,
-    #   }})
-    #   resp = await handle_read_until(state, {{
+    #   })
+    #   resp = await handle_read_until(state, {
     #       "connection_id": connection_id,
     #       "delimiter": "> ",
     #       "timeout_ms": 2000,
-    #   }})
+    #   })
     #   text = resp["data"]
     #
     # Return errors with: return _err("error_code", "Human-readable message")
     # Return success with: return _ok(key1=val1, key2=val2)
-    return _ok(message="Hello from {slug} plugin!")
+    return _ok(message="Hello from $slug plugin!")
 
 
-HANDLERS = {{
-    "{slug}.example": handle_example,
-}}
+HANDLERS: Final = {
+    "$slug.example": handle_example,
+}
 '''
+)
+
+
+# Agents tend to ask for the same device's template repeatedly; both results are
+# immutable, so cached values can be shared between calls.
+@lru_cache(maxsize=32)
+def _plugin_template(name: str, slug: str) -> str:
+    return _PLUGIN_TEMPLATE.substitute(name=name, slug=slug)
 
 
-def _suggest_plugin_path(plugins_dir: Path, device_name: str | None = None) -> Path:
-    name = device_name or "my_device"
-    slug = re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+@lru_cache(maxsize=32)
+def _suggest_plugin_path(plugins_dir: Path, slug: str) -> Path:
     return plugins_dir / f"{slug}.py"
 
 
+@lru_cache(maxsize=64)
+def _as_path(raw_path: str) -> Path:
+    """``Path(raw_path)``, memoized — paths are immutable, so sharing them is safe."""
+    from pathlib import Path
+
+    return Path(raw_path)
+
+
+def _validate_path(raw_path: str) -> tuple[Path | None, dict[str, Any] | None]:
+    """Check the ``path`` argument of serial.plugin.load.
+
+    Returns ``(path, error)``; *error* is an ``_err`` payload when the argument
+    is blank.  The path is otherwise passed through unchanged: the filesystem is
+    only touched by ``PluginManager.load``, after its policy and containment checks.
+    """
+    if not raw_path.strip():
+        return None, _err("invalid_params", "path is required")
+    return _as_path(raw_path), None
+
+
 # ---------------------------------------------------------------------------
 # Tool definitions
 # ---------------------------------------------------------------------------
 
-TOOLS: list[Tool] = [
-    Tool(
-        name="serial.plugin.list",
-        description=(
-            "List loaded plugins with their tool names and metadata. "
-            "Each plugin may include a 'meta' dict with matching hints like "
-            "device_name_contains or description — use these to determine "
-            "which plugin fits the connected device. "
-            "Also returns whether plugins are enabled and the current policy. "
-            "Plugins require SERIAL_MCP_PLUGINS env var — set to 'all' for all or 'name1,name2' to allow specific plugins. "
-            "If disabled, tell the user to set this variable when adding the MCP server."
-        ),
-        inputSchema={
-            "type": "object",
-            "properties": {},
-            "required": [],
-        },
+
+def _string_prop(description: str) -> dict[str, Any]:
+    return {"type": "string", "description": description}
+
+
+def _object_schema(
+    properties: dict[str, dict[str, Any]] | None = None, required: tuple[str, ...] = ()
+) -> dict[str, Any]:
+    """JSON Schema for a tool's arguments object."""
+    return {"type": "object", "properties": properties or {}, "required": list(required)}
+
+
+# Raw (name, description, inputSchema) specs.  ``Tool`` objects are pydantic
+# models, so they are only built — once — when TOOLS is first accessed.
+_TOOL_SPECS: tuple[tuple[str, str, dict[str, Any]], ...] = (
+    (
+        "serial.plugin.list",
+        "List loaded plugins with their tool names and metadata. "
+        "Each plugin may include a 'meta' dict with matching hints like "
+        "device_name_contains or description — use these to determine "
+        "which plugin fits the connected device. "
+        "Also returns whether plugins are enabled and the current policy. "
+        "Plugins require SERIAL_MCP_PLUGINS env var — set to 'all' for all or 'name1,name2' to allow specific plugins. "
+        "If disabled, tell the user to set this variable when adding the MCP server.",
+        _object_schema(),
     ),
-    Tool(
-        name="serial.plugin.reload",
-        description=(
-            "Hot-reload a plugin by name. Re-imports the module and refreshes tools. "
-            "Requires SERIAL_MCP_PLUGINS env var to be set."
+    (
+        "serial.plugin.reload",
+        "Hot-reload a plugin by name. Re-imports the module and refreshes tools. "
+        "Requires SERIAL_MCP_PLUGINS env var to be set.",
+        _object_schema(
+            {"name": _string_prop("Name of the loaded plugin to reload.")},
+            required=("name",),
         ),
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "name": {
-                    "type": "string",
-                    "description": "Name of the loaded plugin to reload.",
-                },
-            },
-            "required": ["name"],
-        },
     ),
-    Tool(
-        name="serial.plugin.template",
-        description=(
-            "Return a Python plugin template. Use this when creating a new plugin. "
-            "Optionally pre-fill with a device name. Save the result to "
-            ".serial_mcp/plugins/<name>.py, fill in the tools and handlers, "
-            "then load with serial.plugin.load."
-        ),
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "device_name": {
-                    "type": "string",
-                    "description": "Device name to pre-fill in the template.",
-                },
-            },
-            "required": [],
-        },
+    (
+        "serial.plugin.template",
+        "Return a Python plugin template. Use this when creating a new plugin. "
+        "Optionally pre-fill with a device name. Save the result to "
+        ".serial_mcp/plugins/<name>.py, fill in the tools and handlers, "
+        "then load with serial.plugin.load.",
+        _object_schema({"device_name": _string_prop("Device name to pre-fill in the template.")}),
     ),
-    Tool(
-        name="serial.plugin.load",
-        description=(
-            "Load a new plugin from a file or directory path. Requires SERIAL_MCP_PLUGINS env var to be set."
+    (
+        "serial.plugin.load",
+        "Load a new plugin from a file or directory path. Requires SERIAL_MCP_PLUGINS env var to be set.",
+        _object_schema(
+            {"path": _string_prop("Path to a .py file or directory containing __init__.py.")},
+            required=("path",),
         ),
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "path": {
-                    "type": "string",
-                    "description": "Path to a .py file or directory containing __init__.py.",
-                },
-            },
-            "required": ["path"],
-        },
     ),
-]
+)
+
+
+@cache
+def get_tools() -> tuple[Tool, ...]:
+    return tuple(Tool(name=n, description=d, inputSchema=schema) for n, d, schema in _TOOL_SPECS)
+
+
+if TYPE_CHECKING:
+    TOOLS: tuple[Tool, ...]
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: keeps ``handlers_plugin.TOOLS`` working while construction stays lazy.
+    if name == "TOOLS":
+        return get_tools()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # ---------------------------------------------------------------------------
 # Handler factory
 # ---------------------------------------------------------------------------
 
 
+# PluginManager exception type -> error code returned to the client.  KeyError
+# (unknown plugin name) is handled by reload alone; from load it is a plugin error.
+_PLUGIN_ERROR_CODES: dict[type[Exception], str] = {
+    PermissionError: "plugins_disabled",
+    ValueError: "plugin_error",
+}
+_PLUGIN_ERRORS = tuple(_PLUGIN_ERROR_CODES)
+
+
+def _plugin_err(exc: Exception) -> dict[str, Any]:
+    # Walk the MRO so subclasses (e.g. UnicodeDecodeError) map like their base.
+    for cls in type(exc).__mro__:
+        code = _PLUGIN_ERROR_CODES.get(cls)
+        if code is not None:
+            return _err(code, str(exc))
+    return _err("plugin_error", str(exc))
+
+
+# Key layout of the serial.plugin.list response (same as ``_ok(...)`` would build);
+# copied per call instead of assembling keyword arguments.
+_LIST_OK_TEMPLATE: dict[str, Any] = {
+    "ok": True,
+    "plugins": None,
+    "count": 0,
+    "plugins_dir": "",
+    "enabled": False,
+    "policy": "",
+}
+
+
 def make_handlers(manager: PluginManager, server: Server) -> dict[str, Any]:
     """Return handler closures that capture *manager* and *server*."""
 
     async def handle_plugin_template(_state: SerialState, args: dict[str, Any]) -> dict[str, Any]:
-        device_name = args.get("device_name")
-        template = _plugin_template(device_name)
-        suggested_path = _suggest_plugin_path(manager.plugins_dir, device_name)
+        name = args.get("device_name") or "my_device"
+        slug = _slugify(name)
+        template = _plugin_template(name, slug)
+        suggested_path = _suggest_plugin_path(manager.plugins_dir, slug)
         return _ok(template=template, suggested_path=str(suggested_path))
 
+    async def _notify_tools_changed() -> bool:
+        """Tell the client the tool list changed; False when there is no live session."""
+        try:
+            await server.request_context.session.send_tool_list_changed()
+            return True
+        except Exception:
+            return False
+
+    # Plugin descriptors (``PluginInfo.payload``), rebuilt only when manager.generation moves.
+    list_cache: tuple[int, list[dict[str, Any]]] | None = None
+    plugins_dir_str = str(manager.plugins_dir)
+
     async def handle_plugin_list(_state: SerialState, _args: dict[str, Any]) -> dict[str, Any]:
-        plugins = [
-            {"name": info.name, "path": str(info.path), "tools": info.tool_names, "meta": info.meta}
-            for info in manager.loaded.values()
-        ]
-        return _ok(
-            plugins=plugins,
-            count=len(plugins),
-            plugins_dir=str(manager.plugins_dir),
-            enabled=manager.enabled,
-            policy=manager.policy,
-        )
+        nonlocal list_cache
+        if list_cache is None or list_cache[0] != manager.generation:
+            plugins = [info.payload for info in manager.loaded.values()]
+            list_cache = (manager.generation, plugins)
+        plugins = list_cache[1]
+        payload = _LIST_OK_TEMPLATE.copy()
+        payload["plugins"] = plugins
+        payload["count"] = len(plugins)
+        payload["plugins_dir"] = plugins_dir_str
+        payload["enabled"] = manager.enabled
+        payload["policy"] = manager.policy
+        return payload
 
     async def handle_plugin_reload(_state: SerialState, args: dict[str, Any]) -> dict[str, Any]:
-        name = args.get("name", "")
+        try:
+            name = args["name"]
+        except KeyError:
+            return _err("invalid_params", "name is required")
         if not name:
             return _err("invalid_params", "name is required")
+        previous = manager.loaded.get(name)
         try:
             info = manager.reload(name)
         except KeyError as exc:
             return _err("not_found", str(exc))
-        except PermissionError as exc:
-            return _err("plugins_disabled", str(exc))
-        except ValueError as exc:
-            return _err("plugin_error", str(exc))
+        except _PLUGIN_ERRORS as exc:
+            return _plugin_err(exc)
 
-        notified = False
-        try:
-            await server.request_context.session.send_tool_list_changed()
-            notified = True
-        except Exception:
-            pass
+        # Only make the client re-fetch the catalog when a definition actually changed.
+        changed = previous is None or info.tools != previous.tools
+        notified = await _notify_tools_changed() if changed else False
 
         return _ok(
             name=info.name,
             tools=info.tool_names,
+            changed=changed,
             notified=notified,
         )
 
     async def handle_plugin_load(_state: SerialState, args: dict[str, Any]) -> dict[str, Any]:
-        raw_path = args.get("path", "")
-        if not raw_path:
+        try:
+            raw_path = args["path"]
+        except KeyError:
             return _err("invalid_params", "path is required")
+        path, error = _validate_path(raw_path)
+        if path is None:
+            return error
         try:
-            info = manager.load(Path(raw_path))
-        except PermissionError as exc:
-            return _err("plugins_disabled", str(exc))
-        except ValueError as exc:
-            return _err("plugin_error", str(exc))
+            info = manager.load(path)
+        except (*_PLUGIN_ERRORS, KeyError) as exc:
+            return _plugin_err(exc)
 
-        notified = False
-        try:
-            await server.request_context.session.send_tool_list_changed()
-            notified = True
-        except Exception:
-            pass
+        notified = await _notify_tools_changed()
 
         return _ok(
             name=info.name,
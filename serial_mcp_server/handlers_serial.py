@@ -3,17 +3,20 @@
 from __future__ import annotations
 
 import asyncio
-import base64
+import binascii
 import logging
 import time
+from collections.abc import Callable
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any
 
 import serial as pyserial
 import serial.tools.list_ports
 from mcp.types import Tool
 
-from serial_mcp_server.helpers import MIRROR_PTY, MIRROR_PTY_LINK, _coerce_bool, _err, _ok
-from serial_mcp_server.mirror import SerialBuffer, create_reader
+from serial_mcp_server.helpers import MIRROR_PTY, MIRROR_PTY_LINK, ToolHandler, _coerce_bool, _err, _ok
+from serial_mcp_server.mirror import SerialBuffer, WriterThread, create_reader
 from serial_mcp_server.state import SerialConnection, SerialState
 
 logger = logging.getLogger("serial_mcp_server")
@@ -46,20 +49,68 @@ BYTESIZE_MAP = {
 # Maximum read size to prevent accidental huge allocations.
 MAX_READ_BYTES = 1_048_576  # 1 MiB
 
+# Maximum decoded payload size for a single serial.write.
+MAX_WRITE_BYTES = 1_048_576  # 1 MiB
+
+# Longest ``data`` string per format that can still decode to MAX_WRITE_BYTES,
+# checked before decoding.  Hex and base64 decoders skip whitespace, so leave
+# room for separators and line wrapping; text is at least one byte per char.
+_MAX_WRITE_CHARS = {
+    "hex": 3 * MAX_WRITE_BYTES,
+    "base64": 2 * MAX_WRITE_BYTES,
+}
+_WRITE_TOO_LARGE = f"data exceeds the {MAX_WRITE_BYTES}-byte write limit."
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
-def _format_data(raw: bytes, fmt: str, encoding: str) -> dict[str, Any]:
-    """Format raw bytes according to *fmt* ("text", "hex", or "base64")."""
-    if fmt == "hex":
-        return {"data": raw.hex(), "format": "hex"}
-    if fmt == "base64":
-        return {"data": base64.b64encode(raw).decode("ascii"), "format": "base64"}
-    # default: text
-    return {"data": raw.decode(encoding, errors="replace"), "format": "text", "encoding": encoding}
+def _format_hex(raw: bytes | memoryview, _encoding: str, out: dict[str, Any]) -> dict[str, Any]:
+    # bytes.hex() builds the str in one pass; b2a_hex(...).decode() is ~2x slower.
+    out["data"] = raw.hex()
+    out["format"] = "hex"
+    return out
+
+
+def _format_base64(raw: bytes | memoryview, _encoding: str, out: dict[str, Any]) -> dict[str, Any]:
+    # binascii directly: base64.b64encode is a Python wrapper around the same call.
+    out["data"] = binascii.b2a_base64(raw, newline=False).decode("ascii")
+    out["format"] = "base64"
+    return out
+
+
+def _format_text(raw: bytes | memoryview, encoding: str, out: dict[str, Any]) -> dict[str, Any]:
+    out["data"] = str(raw, encoding, "replace")
+    out["format"] = "text"
+    out["encoding"] = encoding
+    return out
+
+
+# ``as`` value -> formatter; anything unknown falls back to text.
+_FORMATTERS: dict[str, Callable[[bytes | memoryview, str, dict[str, Any]], dict[str, Any]]] = {
+    "hex": _format_hex,
+    "base64": _format_base64,
+    "text": _format_text,
+}
+
+
+def _format_data(
+    raw: bytes | memoryview, fmt: str, encoding: str, out: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """Format raw bytes according to *fmt* ("text", "hex", or "base64").
+
+    *raw* may be any bytes-like object; a ``memoryview`` is formatted without copying.
+    The fields are added to *out* (a new dict by default), which is returned.
+    """
+    return _FORMATTERS.get(fmt, _format_text)(raw, encoding, {} if out is None else out)
+
+
+@lru_cache(maxsize=16)
+def _encode(text: str, encoding: str) -> bytes:
+    """``text.encode(encoding, errors="replace")``, memoized for delimiters and newlines."""
+    return text.encode(encoding, errors="replace")
 
 
 def _conn_config(conn: SerialConnection) -> dict[str, Any]:
@@ -81,7 +132,7 @@ def _conn_config(conn: SerialConnection) -> dict[str, Any]:
 # Tool definitions
 # ---------------------------------------------------------------------------
 
-TOOLS: list[Tool] = [
+TOOLS: tuple[Tool, ...] = (
     # ---- 1. list_ports ----
     Tool(
         name="serial.list_ports",
@@ -236,6 +287,14 @@ TOOLS: list[Tool] = [
                     "type": "string",
                     "description": "Override newline for append_newline (defaults to connection newline).",
                 },
+                "wait_drain": {
+                    "type": ["boolean", "string"],
+                    "default": False,
+                    "description": (
+                        "Wait until the data has been physically transmitted before returning "
+                        "(default false: return once the OS has accepted it)."
+                    ),
+                },
                 "as": {
                     "type": "string",
                     "enum": ["text", "hex", "base64"],
@@ -400,7 +459,7 @@ TOOLS: list[Tool] = [
             "required": ["connection_id"],
         },
     ),
-]
+)
 
 
 # ---------------------------------------------------------------------------
@@ -408,25 +467,48 @@ TOOLS: list[Tool] = [
 # ---------------------------------------------------------------------------
 
 
-async def handle_list_ports(state: SerialState, args: dict[str, Any]) -> dict[str, Any]:
+# comports() walks /sys (IOKit / SetupAPI elsewhere) on every call and agents
+# tend to call serial.list_ports back to back, so a result is reused briefly.
+_PORTS_TTL_S = 1.0
+# No lock: two callers racing past an expired entry just enumerate twice.
+_ports_cache: tuple[float, list[Any]] | None = None
+
+
+async def _comports() -> list[Any]:
+    global _ports_cache
+    cached = _ports_cache
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < _PORTS_TTL_S:
+        return cached[1]
     ports = await asyncio.to_thread(serial.tools.list_ports.comports)
+    _ports_cache = (now, ports)
+    return ports
+
+
+def _usb_id(value: int | None) -> str | None:
+    return None if value is None else f"0x{value:04X}"
+
+
+_by_device = attrgetter("device")
+
+# Optional ListPortInfo fields, (key, getter); a field is reported only when set.
+_PORT_FIELDS: tuple[tuple[str, Callable[[Any], Any]], ...] = (
+    ("name", attrgetter("name")),
+    ("vid", lambda p: _usb_id(p.vid)),
+    ("pid", lambda p: _usb_id(p.pid)),
+    ("serial_number", attrgetter("serial_number")),
+    ("manufacturer", attrgetter("manufacturer")),
+    ("product", attrgetter("product")),
+    ("location", attrgetter("location")),
+)
+
+
+async def handle_list_ports(state: SerialState, args: dict[str, Any]) -> dict[str, Any]:
+    ports = await _comports()
     port_list = []
-    for p in sorted(ports, key=lambda x: x.device):
+    for p in sorted(ports, key=_by_device):
         info: dict[str, Any] = {"device": p.device, "description": p.description, "hwid": p.hwid}
-        if p.name:
-            info["name"] = p.name
-        if p.vid is not None:
-            info["vid"] = f"0x{p.vid:04X}"
-        if p.pid is not None:
-            info["pid"] = f"0x{p.pid:04X}"
-        if p.serial_number:
-            info["serial_number"] = p.serial_number
-        if p.manufacturer:
-            info["manufacturer"] = p.manufacturer
-        if p.product:
-            info["product"] = p.product
-        if p.location:
-            info["location"] = p.location
+        info.update({key: value for key, get in _PORT_FIELDS if (value := get(p))})
         port_list.append(info)
     return _ok(
         message=f"Found {len(port_list)} serial port(s).",
@@ -447,23 +529,27 @@ async def handle_open(state: SerialState, args: dict[str, Any]) -> dict[str, Any
     encoding = args.get("encoding", "utf-8")
     newline = args.get("newline", "\r\n")
 
-    # Validate parameters
-    if parity not in PARITY_MAP:
+    # Validate parameters and translate them to pyserial constants in one lookup each
+    # (none of the constants is None).
+    ser_parity = PARITY_MAP.get(parity)
+    if ser_parity is None:
         return _err("invalid_params", f"Invalid parity '{parity}'. Must be one of: N, E, O, M, S.")
-    if stopbits not in STOPBITS_MAP:
+    ser_stopbits = STOPBITS_MAP.get(stopbits)
+    if ser_stopbits is None:
         return _err("invalid_params", f"Invalid stopbits '{stopbits}'. Must be one of: 1, 1.5, 2.")
-    if bytesize not in BYTESIZE_MAP:
+    ser_bytesize = BYTESIZE_MAP.get(bytesize)
+    if ser_bytesize is None:
         return _err("invalid_params", f"Invalid bytesize '{bytesize}'. Must be one of: 5, 6, 7, 8.")
     if timeout_ms < 0 or write_timeout_ms < 0:
         return _err("invalid_params", "Timeouts must be non-negative.")
 
     # Check for duplicate port
-    for conn in state.connections.values():
-        if conn.port == port and conn.ser.is_open:
-            return _err(
-                "already_open",
-                f"Port {port} is already open as connection {conn.connection_id}.",
-            )
+    existing = state.connection_for_port(port)
+    if existing is not None and existing.ser.is_open:
+        return _err(
+            "already_open",
+            f"Port {port} is already open as connection {existing.connection_id}.",
+        )
 
     timeout_s = timeout_ms / 1000.0
     write_timeout_s = write_timeout_ms / 1000.0
@@ -471,9 +557,9 @@ async def handle_open(state: SerialState, args: dict[str, Any]) -> dict[str, Any
     kwargs: dict[str, Any] = {
         "port": port,
         "baudrate": baudrate,
-        "bytesize": BYTESIZE_MAP[bytesize],
-        "parity": PARITY_MAP[parity],
-        "stopbits": STOPBITS_MAP[stopbits],
+        "bytesize": ser_bytesize,
+        "parity": ser_parity,
+        "stopbits": ser_stopbits,
         "timeout": timeout_s,
         "write_timeout": write_timeout_s,
     }
@@ -486,6 +572,8 @@ async def handle_open(state: SerialState, args: dict[str, Any]) -> dict[str, Any
     buf = SerialBuffer()
     reader = create_reader(ser, buf, MIRROR_PTY, MIRROR_PTY_LINK)
     reader.start()
+    writer = WriterThread(ser, reader.write_lock)
+    writer.start()
 
     conn = SerialConnection(
         connection_id=connection_id,
@@ -501,10 +589,12 @@ async def handle_open(state: SerialState, args: dict[str, Any]) -> dict[str, Any
         ser=ser,
         buffer=buf,
         reader=reader,
+        writer=writer,
     )
     try:
         state.add_connection(conn)
     except Exception:
+        writer.stop()
         reader.stop()
         ser.close()
         raise
@@ -544,6 +634,11 @@ async def handle_connection_status(state: SerialState, args: dict[str, Any]) ->
     return _ok(message=f"{conn.port} is {'open' if is_open else 'closed'}.", **result)
 
 
+# Below this many buffered bytes, handle_read uses SerialBuffer.read(): the
+# copy it saves is smaller than the cost of a separate allocation.
+_READINTO_MIN = 16384
+
+
 async def handle_read(state: SerialState, args: dict[str, Any]) -> dict[str, Any]:
     conn = state.get_connection(args["connection_id"])
     nbytes = min(int(args.get("nbytes", 256)), MAX_READ_BYTES)
@@ -551,15 +646,27 @@ async def handle_read(state: SerialState, args: dict[str, Any]) -> dict[str, Any
     timeout_ms = args.get("timeout_ms")
     timeout_s = int(timeout_ms) / 1000.0 if timeout_ms is not None else conn.timeout
 
-    raw = await asyncio.to_thread(conn.buffer.read, nbytes, timeout_s)
+    # Large reads go straight into a local buffer sized to what is already
+    # buffered, and a view of it is formatted, saving the intermediate bytes
+    # object.  Small (or not yet arrived) reads are cheaper as a plain read().
+    size = min(nbytes, conn.buffer.available)
+    data: bytes | memoryview
+    if size >= _READINTO_MIN:
+        out = bytearray(size)
+        n_read = await asyncio.to_thread(conn.buffer.readinto, out, timeout_s)
+        data = memoryview(out)[:n_read]
+    else:
+        data = await asyncio.to_thread(conn.buffer.read, max(nbytes, 0), timeout_s)
+        n_read = len(data)
 
     conn.last_seen_ts = time.time()
-    formatted = _format_data(raw, fmt, conn.encoding)
-    return _ok(
-        message=f"Read {len(raw)} byte(s) from {conn.port}.",
-        n_read=len(raw),
-        **formatted,
-    )
+    # Format straight into the response dict (same keys as _ok(..., **formatted)).
+    result: dict[str, Any] = {
+        "ok": True,
+        "message": f"Read {n_read} byte(s) from {conn.port}.",
+        "n_read": n_read,
+    }
+    return _format_data(data, fmt, conn.encoding, result)
 
 
 async def handle_write(state: SerialState, args: dict[str, Any]) -> dict[str, Any]:
@@ -568,7 +675,11 @@ async def handle_write(state: SerialState, args: dict[str, Any]) -> dict[str, An
     fmt = args.get("as", "text")
     encoding = args.get("encoding", conn.encoding)
     append_newline = _coerce_bool(args.get("append_newline", False))
-    newline = args.get("newline", conn.newline)
+    newline = args.get("newline")
+    wait_drain = _coerce_bool(args.get("wait_drain", False))
+
+    if len(data_str) > _MAX_WRITE_CHARS.get(fmt, MAX_WRITE_BYTES):
+        return _err("invalid_value", _WRITE_TOO_LARGE)
 
     # Convert to bytes based on format
     if fmt == "hex":
@@ -578,38 +689,45 @@ async def handle_write(state: SerialState, args: dict[str, Any]) -> dict[str, An
             return _err("invalid_value", "data is not valid hex.")
     elif fmt == "base64":
         try:
-            payload = base64.b64decode(data_str)
+            payload = binascii.a2b_base64(data_str)
         except Exception:
             return _err("invalid_value", "data is not valid base64.")
     else:
         payload = data_str.encode(encoding, errors="replace")
 
     if append_newline:
-        payload += newline.encode(encoding, errors="replace")
-
-    # Use the reader's write_lock to prevent interleaving with PTY→serial
-    # forwarding in rw mirror mode.  Acquire via to_thread to avoid blocking
-    # the event loop if the mirror thread is mid-write.
-    lock = conn.reader.write_lock if conn.reader is not None else None
+        if newline is None and encoding == conn.encoding:
+            payload += conn.newline_bytes
+        else:
+            payload += _encode(conn.newline if newline is None else newline, encoding)
+    if len(payload) > MAX_WRITE_BYTES:
+        return _err("invalid_value", _WRITE_TOO_LARGE)
+
+    if conn.writer is not None:
+        # The connection's writer thread does the write under the reader's write_lock.
+        n_written = await conn.writer.submit(payload, drain=wait_drain)
+    else:
+        # Use the reader's write_lock to prevent interleaving with PTY→serial
+        # forwarding in rw mirror mode.  Acquire via to_thread to avoid blocking
+        # the event loop if the mirror thread is mid-write.
+        lock = conn.reader.write_lock if conn.reader is not None else None
 
-    def _locked_write() -> int:
-        if lock is not None:
-            lock.acquire()
-        try:
-            n = conn.ser.write(payload)
-            conn.ser.flush()
-            return n
-        finally:
+        def _locked_write() -> int:
             if lock is not None:
-                lock.release()
-
-    n_written = await asyncio.to_thread(_locked_write)
+                lock.acquire()
+            try:
+                n = conn.ser.write(payload)
+                if wait_drain:
+                    conn.ser.flush()
+                return n
+            finally:
+                if lock is not None:
+                    lock.release()
+
+        n_written = await asyncio.to_thread(_locked_write)
 
     conn.last_seen_ts = time.time()
-    return _ok(
-        message=f"Wrote {n_written} byte(s) to {conn.port}.",
-        bytes_written=n_written,
-    )
+    return {"ok": True, "message": f"Wrote {n_written} byte(s) to {conn.port}.", "bytes_written": n_written}
 
 
 async def handle_readline(state: SerialState, args: dict[str, Any]) -> dict[str, Any]:
@@ -617,19 +735,20 @@ async def handle_readline(state: SerialState, args: dict[str, Any]) -> dict[str,
     max_bytes = min(int(args.get("max_bytes", 4096)), MAX_READ_BYTES)
     fmt = args.get("as", "text")
     timeout_ms = args.get("timeout_ms")
-    newline = args.get("newline", conn.newline)
-    expected = newline.encode(conn.encoding, errors="replace")
+    newline = args.get("newline")
+    expected = conn.newline_bytes if newline is None else _encode(newline, conn.encoding)
     timeout_s = int(timeout_ms) / 1000.0 if timeout_ms is not None else conn.timeout
 
     raw = await asyncio.to_thread(conn.buffer.read_until, expected, max_bytes, timeout_s)
 
     conn.last_seen_ts = time.time()
-    formatted = _format_data(raw, fmt, conn.encoding)
-    return _ok(
-        message=f"Read {len(raw)} byte(s) from {conn.port}.",
-        n_read=len(raw),
-        **formatted,
-    )
+    n_read = len(raw)
+    result: dict[str, Any] = {
+        "ok": True,
+        "message": f"Read {n_read} byte(s) from {conn.port}.",
+        "n_read": n_read,
+    }
+    return _format_data(raw, fmt, conn.encoding, result)
 
 
 async def handle_read_until(state: SerialState, args: dict[str, Any]) -> dict[str, Any]:
@@ -638,18 +757,19 @@ async def handle_read_until(state: SerialState, args: dict[str, Any]) -> dict[st
     max_bytes = min(int(args.get("max_bytes", 4096)), MAX_READ_BYTES)
     fmt = args.get("as", "text")
     timeout_ms = args.get("timeout_ms")
-    expected = delimiter.encode(conn.encoding, errors="replace")
+    expected = _encode(delimiter, conn.encoding)
     timeout_s = int(timeout_ms) / 1000.0 if timeout_ms is not None else conn.timeout
 
     raw = await asyncio.to_thread(conn.buffer.read_until, expected, max_bytes, timeout_s)
 
     conn.last_seen_ts = time.time()
-    formatted = _format_data(raw, fmt, conn.encoding)
-    return _ok(
-        message=f"Read {len(raw)} byte(s) from {conn.port}.",
-        n_read=len(raw),
-        **formatted,
-    )
+    n_read = len(raw)
+    result: dict[str, Any] = {
+        "ok": True,
+        "message": f"Read {n_read} byte(s) from {conn.port}.",
+        "n_read": n_read,
+    }
+    return _format_data(raw, fmt, conn.encoding, result)
 
 
 async def handle_flush(state: SerialState, args: dict[str, Any]) -> dict[str, Any]:
@@ -690,23 +810,43 @@ async def handle_set_rts(state: SerialState, args: dict[str, Any]) -> dict[str,
 
 _MAX_PULSE_MS = 10_000
 
+# Pulses shorter than this run low→sleep→high on a worker thread: a blocking
+# sleep (nanosleep) is far more precise than an event-loop timer at this scale.
+_SHORT_PULSE_MS = 5
+
+
+def _pulse_line_blocking(ser: pyserial.Serial, line: str, seconds: float) -> None:
+    setattr(ser, line, False)
+    try:
+        time.sleep(seconds)
+    finally:
+        setattr(ser, line, True)
+
+
+async def _pulse_line(ser: pyserial.Serial, line: str, duration_ms: int) -> None:
+    """Drive control *line* ("dtr" or "rts") low for *duration_ms*, then high."""
+    if duration_ms < _SHORT_PULSE_MS:
+        await asyncio.to_thread(_pulse_line_blocking, ser, line, duration_ms / 1000.0)
+        return
+    setattr(ser, line, False)
+    try:
+        await asyncio.sleep(duration_ms / 1000.0)
+    finally:
+        setattr(ser, line, True)
+
 
 async def handle_pulse_dtr(state: SerialState, args: dict[str, Any]) -> dict[str, Any]:
     conn = state.get_connection(args["connection_id"])
-    duration_ms = min(int(args.get("duration_ms", 100)), _MAX_PULSE_MS)
-    conn.ser.dtr = False
-    await asyncio.sleep(duration_ms / 1000.0)
-    conn.ser.dtr = True
+    duration_ms = max(0, min(int(args.get("duration_ms", 100)), _MAX_PULSE_MS))
+    await _pulse_line(conn.ser, "dtr", duration_ms)
     conn.last_seen_ts = time.time()
     return _ok(message=f"Pulsed DTR low for {duration_ms}ms on {conn.port}.", duration_ms=duration_ms)
 
 
 async def handle_pulse_rts(state: SerialState, args: dict[str, Any]) -> dict[str, Any]:
     conn = state.get_connection(args["connection_id"])
-    duration_ms = min(int(args.get("duration_ms", 100)), _MAX_PULSE_MS)
-    conn.ser.rts = False
-    await asyncio.sleep(duration_ms / 1000.0)
-    conn.ser.rts = True
+    duration_ms = max(0, min(int(args.get("duration_ms", 100)), _MAX_PULSE_MS))
+    await _pulse_line(conn.ser, "rts", duration_ms)
     conn.last_seen_ts = time.time()
     return _ok(message=f"Pulsed RTS low for {duration_ms}ms on {conn.port}.", duration_ms=duration_ms)
 
@@ -715,7 +855,7 @@ async def handle_pulse_rts(state: SerialState, args: dict[str, Any]) -> dict[str
 # Handler map
 # ---------------------------------------------------------------------------
 
-HANDLERS: dict[str, Any] = {
+HANDLERS: dict[str, ToolHandler] = {
     "serial.list_ports": handle_list_ports,
     "serial.open": handle_open,
     "serial.close": handle_close,
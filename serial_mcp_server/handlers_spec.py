@@ -7,14 +7,14 @@ from typing import Any
 from mcp.types import Tool
 
 from serial_mcp_server import specs
-from serial_mcp_server.helpers import _err, _ok
+from serial_mcp_server.helpers import ToolHandler, _err, _ok
 from serial_mcp_server.state import SerialState
 
 # ---------------------------------------------------------------------------
 # Tool definitions
 # ---------------------------------------------------------------------------
 
-TOOLS: list[Tool] = [
+TOOLS: tuple[Tool, ...] = (
     Tool(
         name="serial.spec.template",
         description=(
@@ -121,7 +121,7 @@ TOOLS: list[Tool] = [
             "required": ["spec_id", "query"],
         },
     ),
-]
+)
 
 # ---------------------------------------------------------------------------
 # Handlers
@@ -204,7 +204,7 @@ async def handle_spec_search(_state: SerialState, args: dict[str, Any]) -> dict[
     return _ok(results=results, count=len(results))
 
 
-HANDLERS: dict[str, Any] = {
+HANDLERS: dict[str, ToolHandler] = {
     "serial.spec.template": handle_spec_template,
     "serial.spec.register": handle_spec_register,
     "serial.spec.list": handle_spec_list,
@@ -6,7 +6,7 @@ from typing import Any
 
 from mcp.types import Tool
 
-from serial_mcp_server.helpers import _ok
+from serial_mcp_server.helpers import ToolHandler, _ok
 from serial_mcp_server.state import SerialState
 from serial_mcp_server.trace import get_trace_buffer
 
@@ -14,7 +14,7 @@ from serial_mcp_server.trace import get_trace_buffer
 # Tool definitions
 # ---------------------------------------------------------------------------
 
-TOOLS: list[Tool] = [
+TOOLS: tuple[Tool, ...] = (
     Tool(
         name="serial.trace.status",
         description="Return tracing config and event count.",
@@ -39,7 +39,7 @@ TOOLS: list[Tool] = [
             "required": [],
         },
     ),
-]
+)
 
 # ---------------------------------------------------------------------------
 # Handlers
@@ -61,7 +61,7 @@ async def handle_trace_tail(_state: SerialState, args: dict[str, Any]) -> dict[s
     return _ok(events=buf.tail(n))
 
 
-HANDLERS: dict[str, Any] = {
+HANDLERS: dict[str, ToolHandler] = {
     "serial.trace.status": handle_trace_status,
     "serial.trace.tail": handle_trace_tail,
 }
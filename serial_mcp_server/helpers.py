@@ -5,12 +5,24 @@ from __future__ import annotations
 import json
 import logging
 import os
-from typing import Any
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
 
 from mcp.types import TextContent
 
+try:
+    import orjson
+except ImportError:  # optional: pip install serial-mcp-server[fast]
+    orjson = None
+
+if TYPE_CHECKING:
+    from serial_mcp_server.state import SerialState
+
 logger = logging.getLogger("serial_mcp_server")
 
+# Signature of every entry in a handler module's HANDLERS dict.
+ToolHandler = Callable[["SerialState", dict[str, Any]], Awaitable[dict[str, Any]]]
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -49,5 +61,22 @@ def _err(code: str, message: str) -> dict[str, Any]:
     return {"ok": False, "error": {"code": code, "message": message}}
 
 
+# Dataclasses and datetimes go through ``default=str`` like they do with json.dumps.
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+    if orjson is not None
+    else 0
+)
+
+
+def _dumps(payload: dict[str, Any]) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, default=str, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            pass  # e.g. an int wider than 64 bits; json.dumps handles it.
+    return json.dumps(payload, default=str)
+
+
 def _result_text(payload: dict[str, Any]) -> list[TextContent]:
-    return [TextContent(type="text", text=json.dumps(payload, default=str))]
+    return [TextContent(type="text", text=_dumps(payload))]
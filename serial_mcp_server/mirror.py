@@ -3,14 +3,17 @@
 Provides:
 - ``SerialBuffer``: thread-safe byte buffer with blocking reads
 - ``ReaderThread``: background thread that reads from serial into buffer
+- ``WriterThread``: background thread that performs queued serial writes
 - ``MirrorSession``: extends ReaderThread with PTY tee (Unix only)
 - ``create_reader``: factory that picks the right reader based on config
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
+import queue
 import sys
 import threading
 import time
@@ -22,10 +25,17 @@ _IS_UNIX = sys.platform != "win32"
 
 if _IS_UNIX:
     import fcntl
-    import select
+    import selectors
     import termios
     import tty
 
+    # Baud rate -> termios speed constant (B9600, B115200, ...), built once.
+    _BAUD_CODES: dict[int, int] = {
+        int(name[1:]): value
+        for name, value in vars(termios).items()
+        if name[0] == "B" and name[1:].isdigit() and isinstance(value, int)
+    }
+
 
 # ---------------------------------------------------------------------------
 # SerialBuffer — thread-safe byte buffer
@@ -44,6 +54,25 @@ class SerialBuffer:
         self._lock = threading.Lock()
         self._cond = threading.Condition(self._lock)
         self._max_size = max_size
+        # Total bytes ever removed from the front of _buf (reads, trims, clear).
+        # Lets read_until keep its scan position across waits.
+        self._consumed = 0
+
+    # Above this size _take copies through a memoryview: one copy instead of
+    # slice-then-bytes.  Below it the view setup costs more than it saves.
+    _VIEW_COPY_MIN = 16384
+
+    def _take(self, n: int) -> bytes:
+        """Remove and return the first *n* bytes.  Caller holds the lock."""
+        if n >= self._VIEW_COPY_MIN:
+            # The view must be released before the del below resizes _buf.
+            with memoryview(self._buf) as view:
+                result = view[:n].tobytes()
+        else:
+            result = bytes(self._buf[:n])
+        del self._buf[:n]
+        self._consumed += n
+        return result
 
     def write(self, data: bytes) -> None:
         """Append data to the buffer and wake any waiting readers."""
@@ -55,6 +84,7 @@ class SerialBuffer:
             if len(self._buf) > self._max_size:
                 excess = len(self._buf) - self._max_size
                 del self._buf[:excess]
+                self._consumed += excess
             self._cond.notify_all()
 
     def read(self, nbytes: int, timeout: float) -> bytes:
@@ -66,45 +96,68 @@ class SerialBuffer:
                 if remaining <= 0:
                     return b""
                 self._cond.wait(timeout=remaining)
-            n = min(nbytes, len(self._buf))
-            result = bytes(self._buf[:n])
+            return self._take(min(nbytes, len(self._buf)))
+
+    def readinto(self, out: bytearray, timeout: float) -> int:
+        """Like :meth:`read` with ``nbytes=len(out)``, but copy into *out*.
+
+        Returns the number of bytes copied (0 on timeout).  Saves the
+        intermediate ``bytes`` object that :meth:`read` has to build.
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while not self._buf:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return 0
+                self._cond.wait(timeout=remaining)
+            n = min(len(out), len(self._buf))
+            with memoryview(self._buf) as view:
+                out[:n] = view[:n]
             del self._buf[:n]
-            return result
+            self._consumed += n
+            return n
 
     def read_until(self, delimiter: bytes, max_bytes: int, timeout: float) -> bytes:
         """Read until *delimiter* is found, *max_bytes* reached, or *timeout* expires."""
         deadline = time.monotonic() + timeout
+        # Absolute stream position the next search starts from: bytes already
+        # scanned are not searched again after a wakeup, only the new tail
+        # (plus len(delimiter) - 1 bytes of overlap).
+        scan_from = 0
         with self._cond:
             while True:
-                idx = self._buf.find(delimiter)
+                idx = self._buf.find(delimiter, max(scan_from - self._consumed, 0))
                 if idx != -1:
-                    end = min(idx + len(delimiter), max_bytes)
-                    result = bytes(self._buf[:end])
-                    del self._buf[:end]
-                    return result
+                    return self._take(min(idx + len(delimiter), max_bytes))
                 if len(self._buf) >= max_bytes:
-                    result = bytes(self._buf[:max_bytes])
-                    del self._buf[:max_bytes]
-                    return result
+                    return self._take(max_bytes)
                 remaining = deadline - time.monotonic()
                 if remaining <= 0:
                     # Return whatever we have.
-                    n = min(len(self._buf), max_bytes)
-                    result = bytes(self._buf[:n])
-                    del self._buf[:n]
-                    return result
+                    return self._take(min(len(self._buf), max_bytes))
+                scan_from = self._consumed + max(len(self._buf) - len(delimiter) + 1, 0)
                 self._cond.wait(timeout=remaining)
 
     def clear(self) -> None:
         """Discard all buffered data."""
+        if not self._buf:
+            # Lock-free emptiness check, as in ``available``; bytes racing in
+            # now were not "already buffered" when clear() was called.
+            return
         with self._lock:
+            self._consumed += len(self._buf)
             self._buf.clear()
 
     @property
     def available(self) -> int:
-        """Number of bytes currently in the buffer."""
-        with self._lock:
-            return len(self._buf)
+        """Number of bytes currently in the buffer.
+
+        Read without the lock: ``len()`` of a bytearray is a single atomic
+        load, so this is at worst one in-flight write or read out of date.
+        Use :meth:`read` / :meth:`read_until` when exactness matters.
+        """
+        return len(self._buf)
 
 
 # ---------------------------------------------------------------------------
@@ -143,15 +196,17 @@ class ReaderThread:
         while not self._stop.is_set():
             try:
                 waiting = self.ser.in_waiting
-                if waiting:
-                    data = self.ser.read(waiting)
-                    if data:
-                        self._on_data(data)
-                else:
-                    # Block for up to 1 byte with the serial port's own timeout.
-                    data = self.ser.read(1)
-                    if data:
-                        self._on_data(data)
+                # With nothing waiting, block for up to 1 byte with the serial
+                # port's own timeout.
+                data = self.ser.read(waiting or 1)
+                if data:
+                    if not waiting:
+                        # That byte is usually the start of a burst: take what
+                        # arrived behind it now rather than on the next pass.
+                        extra = self.ser.in_waiting
+                        if extra:
+                            data += self.ser.read(extra)
+                    self._on_data(data)
                 errors = 0
             except Exception:
                 if self._stop.is_set():
@@ -173,6 +228,141 @@ class ReaderThread:
         return None
 
 
+# ---------------------------------------------------------------------------
+# WriterThread — dedicated serial writer (cross-platform)
+# ---------------------------------------------------------------------------
+
+
+def _resolve(fut: asyncio.Future[int], result: int | BaseException) -> None:
+    """Complete *fut* on its loop unless the awaiting handler already gave up."""
+    if fut.done():
+        return
+    if isinstance(result, BaseException):
+        fut.set_exception(result)
+    else:
+        fut.set_result(result)
+
+
+# (payload, drain, future, loop) — one queued serial.write call.
+_WriteItem = tuple[bytes, bool, asyncio.Future[int], asyncio.AbstractEventLoop]
+
+
+class WriterThread:
+    """Background thread that owns writes to a serial port.
+
+    Handlers hand payloads to :meth:`submit` and await the returned future
+    rather than dispatching every write through the default executor.
+    Writes hold *write_lock* so they don't interleave with PTY→serial
+    forwarding in rw mirror mode.
+    """
+
+    def __init__(self, ser: Any, write_lock: threading.Lock) -> None:
+        self.ser = ser
+        self.write_lock = write_lock
+        self._queue: queue.SimpleQueue[_WriteItem | None] = queue.SimpleQueue()
+        # Guards ``_closed`` so nothing is queued after the stop sentinel.
+        self._submit_lock = threading.Lock()
+        self._closed = False
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, daemon=True, name="serial-writer")
+        self._thread.start()
+
+    # Seconds stop() waits for queued writes before failing the rest.
+    _STOP_TIMEOUT = 3.0
+
+    def stop(self) -> None:
+        """Let queued writes finish, then stop the thread."""
+        with self._submit_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=self._STOP_TIMEOUT)
+            self._thread = None
+        # Anything the thread did not get to (join timed out) fails instead of hanging.
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                _, _, fut, loop = item
+                loop.call_soon_threadsafe(_resolve, fut, RuntimeError("Serial writer stopped"))
+        if thread is not None and thread.is_alive():
+            # The drain above took the stop sentinel too; a writer still busy
+            # with a write needs it back to exit once that write returns.
+            self._queue.put(None)
+
+    @property
+    def alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def submit(self, payload: bytes, *, drain: bool = False) -> asyncio.Future[int]:
+        """Queue *payload*; the future resolves to the number of bytes written.
+
+        With *drain*, the write is followed by ``ser.flush()`` (wait until
+        the bytes have left the UART).  Must be called from a running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        fut: asyncio.Future[int] = loop.create_future()
+        with self._submit_lock:
+            if self._closed:
+                raise RuntimeError("Serial writer stopped")
+            self._queue.put((payload, drain, fut, loop))
+        return fut
+
+    # Queued payloads are merged into one ``ser.write`` up to this many bytes.
+    _COALESCE_BYTES = 4096
+
+    def _run(self) -> None:
+        running = True
+        while running:
+            item = self._queue.get()
+            if item is None:
+                break
+            batch = [item]
+            size = len(item[0])
+            # Drain whatever else is already queued so small writes share a syscall.
+            while size < self._COALESCE_BYTES:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    running = False
+                    break
+                batch.append(item)
+                size += len(item[0])
+            self._write_batch(batch)
+
+    def _write_batch(self, batch: list[_WriteItem]) -> None:
+        payload = batch[0][0] if len(batch) == 1 else b"".join(item[0] for item in batch)
+        drain = any(item[1] for item in batch)
+        written: int | BaseException
+        try:
+            with self.write_lock:
+                written = self.ser.write(payload)
+                if drain:
+                    self.ser.flush()
+        except Exception as exc:
+            written = exc
+        remaining = written
+        for chunk, _, fut, loop in batch:
+            result = remaining
+            if len(batch) > 1 and isinstance(remaining, int):
+                # Hand each caller its share of the bytes written, in queue order.
+                result = min(len(chunk), remaining)
+                remaining -= result
+            try:
+                loop.call_soon_threadsafe(_resolve, fut, result)
+            except RuntimeError:
+                pass  # Event loop already closed.
+
+
 # ---------------------------------------------------------------------------
 # MirrorSession — PTY tee on top of ReaderThread (Unix only)
 # ---------------------------------------------------------------------------
@@ -208,7 +398,7 @@ class MirrorSession(ReaderThread):
         try:
             tty.setraw(self._slave_fd)
             attrs = termios.tcgetattr(self._slave_fd)
-            baud = getattr(termios, f"B{ser.baudrate}", termios.B115200)
+            baud = _BAUD_CODES.get(ser.baudrate, termios.B115200)
             attrs[4] = baud  # ispeed
             attrs[5] = baud  # ospeed
             termios.tcsetattr(self._slave_fd, termios.TCSANOW, attrs)
@@ -222,8 +412,11 @@ class MirrorSession(ReaderThread):
         self._link_created = False
         if self.link_path:
             try:
-                if os.path.islink(self.link_path) or os.path.exists(self.link_path):
+                # Remove a stale link (or a file) left by a previous session.
+                try:
                     os.unlink(self.link_path)
+                except FileNotFoundError:
+                    pass
                 os.symlink(self.pty_slave_path, self.link_path)
                 self._link_created = True
             except OSError as exc:
@@ -252,18 +445,29 @@ class MirrorSession(ReaderThread):
 
     def _run(self) -> None:
         ser_fd = self.ser.fileno()
-        read_fds = [ser_fd, self._master_fd] if self.mode == "rw" else [ser_fd]
-
+        # Registered once for the life of the thread (epoll/kqueue where
+        # available) instead of passing the fd list to select() every tick.
+        sel = selectors.DefaultSelector()
+        try:
+            sel.register(ser_fd, selectors.EVENT_READ)
+            if self.mode == "rw":
+                sel.register(self._master_fd, selectors.EVENT_READ)
+            self._poll(sel, ser_fd)
+        finally:
+            sel.close()
+
+    def _poll(self, sel: selectors.BaseSelector, ser_fd: int) -> None:
         while not self._stop.is_set():
             try:
-                readable, _, _ = select.select(read_fds, [], [], 0.05)
+                events = sel.select(timeout=0.05)
             except (OSError, ValueError):
                 if self._stop.is_set():
                     break
                 time.sleep(0.1)
                 continue
 
-            for fd in readable:
+            for key, _mask in events:
+                fd = key.fd
                 if fd == ser_fd:
                     try:
                         waiting = self.ser.in_waiting
@@ -9,8 +9,9 @@ import hashlib
 import importlib.util
 import logging
 import os
+import stat
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -52,9 +53,24 @@ def parse_plugin_policy() -> tuple[bool, set[str] | None]:
 class PluginInfo:
     name: str
     path: Path
-    tool_names: list[str]
+    tool_names: tuple[str, ...]
     module_key: str
     meta: dict[str, Any]
+    tools: tuple[Tool, ...] = ()
+    path_str: str = field(init=False)
+    payload: dict[str, Any] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Stringified once here rather than on every serial.plugin.list call.
+        self.path_str = str(self.path)
+        # serial.plugin.list entry for this plugin, built once per load.
+        # Treat as read-only; it is shared by every list response.
+        self.payload = {
+            "name": self.name,
+            "path": self.path_str,
+            "tools": self.tool_names,
+            "meta": self.meta,
+        }
 
 
 # ---------------------------------------------------------------------------
@@ -62,20 +78,38 @@ class PluginInfo:
 # ---------------------------------------------------------------------------
 
 
-def load_plugin(plugin_path: Path) -> tuple[str, list[Tool], dict[str, Any], str, dict[str, Any]]:
+def _stat_or_none(path: Path) -> os.stat_result | None:
+    try:
+        return path.stat()
+    except (OSError, ValueError):
+        return None
+
+
+def load_plugin(
+    plugin_path: Path,
+    *,
+    stat_hint: os.stat_result | None = None,
+    resolved: Path | None = None,
+) -> tuple[str, list[Tool], dict[str, Any], str, dict[str, Any]]:
     """Load a single plugin file/package and validate its exports.
 
+    *stat_hint* is an ``os.stat`` result the caller already has for
+    *plugin_path*; when given, the path is not stat'ed again.  Likewise
+    *resolved* is ``plugin_path.resolve()`` when the caller already has it.
+
     Returns ``(name, tools, handlers, module_key)``.
     Raises ``ValueError`` on any validation failure.
     """
-    resolved = plugin_path.resolve()
+    if resolved is None:
+        resolved = plugin_path.resolve()
+    st = stat_hint if stat_hint is not None else _stat_or_none(resolved)
 
-    if resolved.is_dir():
+    if st is not None and stat.S_ISDIR(st.st_mode):
         name = resolved.name
         entry = resolved / "__init__.py"
         if not entry.exists():
             raise ValueError(f"Plugin directory {resolved} has no __init__.py")
-    elif resolved.is_file() and resolved.suffix == ".py":
+    elif st is not None and stat.S_ISREG(st.st_mode) and resolved.suffix == ".py":
         name = resolved.stem
         entry = resolved
     else:
@@ -96,28 +130,39 @@ def load_plugin(plugin_path: Path) -> tuple[str, list[Tool], dict[str, Any], str
 
     module = importlib.util.module_from_spec(spec)
     sys.modules[module_key] = module
+    # Single cleanup site: any failure from here on unregisters the module.
     try:
-        spec.loader.exec_module(module)
-    except Exception as exc:
+        try:
+            spec.loader.exec_module(module)
+        except Exception as exc:
+            raise ValueError(f"Error executing plugin {name}: {exc}") from exc
+        tools, handlers, meta = _validate_exports(name, module)
+    except BaseException:
         sys.modules.pop(module_key, None)
-        raise ValueError(f"Error executing plugin {name}: {exc}") from exc
+        raise
+
+    return name, tools, handlers, module_key, meta
+
+
+def _validate_exports(name: str, module: Any) -> tuple[list[Tool], dict[str, Any], dict[str, Any]]:
+    """Check a plugin module's TOOLS/HANDLERS/META; return ``(tools, handlers, meta)``.
 
-    # --- Validate exports ---
+    Raises ``ValueError`` on any validation failure.
+    """
     tools = getattr(module, "TOOLS", None)
     handlers = getattr(module, "HANDLERS", None)
 
-    if not isinstance(tools, list):
-        sys.modules.pop(module_key, None)
-        raise ValueError(f"Plugin {name}: TOOLS must be a list, got {type(tools)}")
+    if not isinstance(tools, (list, tuple)):
+        raise ValueError(f"Plugin {name}: TOOLS must be a list or tuple, got {type(tools)}")
     if not isinstance(handlers, dict):
-        sys.modules.pop(module_key, None)
         raise ValueError(f"Plugin {name}: HANDLERS must be a dict, got {type(handlers)}")
 
     tool_names = {t.name for t in tools}
-    handler_names = set(handlers.keys())
 
-    if tool_names != handler_names:
-        sys.modules.pop(module_key, None)
+    # A keys view compares with a set directly; the handler-name set is only
+    # needed to describe a mismatch.
+    if tool_names != handlers.keys():
+        handler_names = set(handlers)
         only_tools = tool_names - handler_names
         only_handlers = handler_names - tool_names
         parts = []
@@ -131,7 +176,7 @@ def load_plugin(plugin_path: Path) -> tuple[str, list[Tool], dict[str, Any], str
     if not isinstance(meta, dict):
         meta = {}
 
-    return name, tools, handlers, module_key, meta
+    return list(tools), handlers, meta
 
 
 # ---------------------------------------------------------------------------
@@ -146,17 +191,23 @@ def discover_plugins(plugins_dir: Path) -> list[Path]:
     - Subdirs containing ``__init__.py`` → path to the subdir
     - Ignores ``__pycache__`` and dotfiles/dotdirs.
     """
-    if not plugins_dir.is_dir():
+    # scandir entries carry their file type from the directory listing, so
+    # is_file()/is_dir() usually need no extra stat.
+    try:
+        with os.scandir(plugins_dir) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except (FileNotFoundError, NotADirectoryError):
         return []
 
     results: list[Path] = []
-    for child in sorted(plugins_dir.iterdir()):
-        if child.name.startswith(".") or child.name == "__pycache__":
+    for entry in entries:
+        name = entry.name
+        if name.startswith(".") or name == "__pycache__":
             continue
-        if (child.is_file() and child.suffix == ".py" and child.name != "__init__.py") or (
-            child.is_dir() and (child / "__init__.py").exists()
+        if (entry.is_file() and name.endswith(".py") and name != "__init__.py") or (
+            entry.is_dir() and os.path.exists(os.path.join(entry.path, "__init__.py"))
         ):
-            results.append(child)
+            results.append(plugins_dir / name)
 
     return results
 
@@ -180,10 +231,14 @@ class PluginManager:
     ) -> None:
         self.plugins_dir = plugins_dir
         self._tools = tools
+        # Names in ``_tools``, kept in step with it for O(1) collision checks.
+        self._tool_names = {t.name for t in tools}
         self._handlers = handlers
         self.enabled = enabled
         self.allowlist = allowlist
         self.loaded: dict[str, PluginInfo] = {}
+        # Bumped whenever ``loaded`` changes, so callers can cache views of it.
+        self.generation = 0
 
     @property
     def policy(self) -> str:
@@ -206,10 +261,9 @@ class PluginManager:
             )
 
     @staticmethod
-    def _plugin_name_from_path(plugin_path: Path) -> str:
-        """Derive the plugin name from a path without executing any code."""
-        resolved = plugin_path.resolve()
-        if resolved.is_dir():
+    def _plugin_name_from_path(resolved: Path, st: os.stat_result | None) -> str:
+        """Derive the plugin name from a resolved path and its stat, without executing any code."""
+        if st is not None and stat.S_ISDIR(st.st_mode):
             return resolved.name
         return resolved.stem
 
@@ -224,10 +278,13 @@ class PluginManager:
         if plugins_root not in resolved.parents and resolved != plugins_root:
             raise ValueError(f"Plugin path must be inside {self.plugins_dir}/ — got {plugin_path}")
 
+        # One stat, shared by the policy check and load_plugin.
+        st = _stat_or_none(resolved)
+
         # Check policy BEFORE executing any plugin code
-        self._check_allowed(self._plugin_name_from_path(plugin_path))
+        self._check_allowed(self._plugin_name_from_path(resolved, st))
 
-        name, tools, handlers, module_key, meta = load_plugin(plugin_path)
+        name, tools, handlers, module_key, meta = load_plugin(plugin_path, stat_hint=st, resolved=resolved)
 
         # If already loaded, unload first (makes load idempotent)
         if name in self.loaded:
@@ -235,23 +292,25 @@ class PluginManager:
             self.unload(name)
 
         # Check for name collisions
-        existing_names = {t.name for t in self._tools}
         for tool in tools:
-            if tool.name in existing_names:
+            if tool.name in self._tool_names:
                 # Clean up the module we just loaded
                 sys.modules.pop(module_key, None)
                 raise ValueError(f"Plugin {name}: tool '{tool.name}' collides with an existing tool")
 
         self._tools.extend(tools)
+        self._tool_names.update(t.name for t in tools)
         self._handlers.update(handlers)
         info = PluginInfo(
             name=name,
-            path=plugin_path.resolve(),
-            tool_names=[t.name for t in tools],
+            path=resolved,
+            tool_names=tuple(t.name for t in tools),
             module_key=module_key,
-            meta=meta,
+            meta=dict(meta),
+            tools=tuple(tools),
         )
         self.loaded[name] = info
+        self.generation += 1
         logger.info("Loaded plugin %s with tools: %s", name, info.tool_names)
         return info
 
@@ -266,8 +325,12 @@ class PluginManager:
         info = self.loaded[name]
         names_to_remove = set(info.tool_names)
 
-        # Filter tools list in-place
-        self._tools[:] = [t for t in self._tools if t.name not in names_to_remove]
+        # Remove this plugin's tools in place; a plugin has only a few, so
+        # deleting them is cheaper than rebuilding the whole list.
+        idxs = [i for i, t in enumerate(self._tools) if t.name in names_to_remove]
+        for i in reversed(idxs):
+            del self._tools[i]
+        self._tool_names -= names_to_remove
 
         # Remove handlers
         for tool_name in info.tool_names:
@@ -277,6 +340,7 @@ class PluginManager:
         sys.modules.pop(info.module_key, None)
 
         del self.loaded[name]
+        self.generation += 1
         logger.info("Unloaded plugin %s", name)
 
     def reload(self, name: str) -> PluginInfo:
@@ -24,6 +24,7 @@ from serial_mcp_server import (
 )
 from serial_mcp_server.helpers import (
     MAX_CONNECTIONS,
+    ToolHandler,
     _err,
     _result_text,
 )
@@ -53,14 +54,16 @@ def build_server() -> tuple[Server, SerialState]:
     state = SerialState(max_connections=MAX_CONNECTIONS)
     server = Server("serial-mcp-server")
 
-    tools: list[Tool] = (
-        handlers_serial.TOOLS
-        + handlers_introspection.TOOLS
-        + handlers_spec.TOOLS
-        + handlers_trace.TOOLS
-        + handlers_plugin.TOOLS
-    )
-    handlers: dict[str, Any] = {
+    # Built once per server; PluginManager appends plugin tools and handlers
+    # to these, so they are fresh containers rather than the module tuples.
+    tools: list[Tool] = [
+        *handlers_serial.TOOLS,
+        *handlers_introspection.TOOLS,
+        *handlers_spec.TOOLS,
+        *handlers_trace.TOOLS,
+        *handlers_plugin.TOOLS,
+    ]
+    handlers: dict[str, ToolHandler] = {
         **handlers_serial.HANDLERS,
         **handlers_introspection.HANDLERS,
         **handlers_spec.HANDLERS,
@@ -84,21 +87,7 @@ def build_server() -> tuple[Server, SerialState]:
     async def _list_tools() -> list[Tool]:
         return tools
 
-    @server.call_tool()
-    async def _call_tool(name: str, arguments: dict[str, Any] | None) -> list[TextContent]:
-        arguments = arguments or {}
-
-        buf = get_trace_buffer()
-        if buf:
-            cid = arguments.get("connection_id")
-            safe_args = sanitize_args(arguments)
-            buf.emit({"event": "tool_call_start", "tool": name, "args": safe_args, "connection_id": cid})
-            t0 = time.monotonic()
-
-        handler = handlers.get(name)
-        if handler is None:
-            return _result_text(_err("unknown_tool", f"No tool named {name}"))
-
+    async def _run_handler(name: str, handler: ToolHandler, arguments: dict[str, Any]) -> dict[str, Any]:
         try:
             result = await handler(state, arguments)
         except KeyError as exc:
@@ -121,25 +110,53 @@ def build_server() -> tuple[Server, SerialState]:
             conn = state.connections.get(arguments["connection_id"])
             if conn:
                 conn.last_seen_ts = time.time()
+        return result
+
+    # Tracing is fixed for the life of the server, so pick the dispatcher once:
+    # with tracing off, calls skip argument sanitizing and event building.
+    buf = init_trace()
+
+    if buf is None:
+
+        @server.call_tool()
+        async def _call_tool(name: str, arguments: dict[str, Any] | None) -> list[TextContent]:
+            handler = handlers.get(name)
+            if handler is None:
+                return _result_text(_err("unknown_tool", f"No tool named {name}"))
+            return _result_text(await _run_handler(name, handler, arguments or {}))
+
+    else:
+
+        @server.call_tool()
+        async def _call_tool(name: str, arguments: dict[str, Any] | None) -> list[TextContent]:
+            arguments = arguments or {}
+
+            cid = arguments.get("connection_id")
+            safe_args = sanitize_args(arguments)
+            buf.emit({"event": "tool_call_start", "tool": name, "args": safe_args, "connection_id": cid})
+            t0 = time.monotonic()
+
+            handler = handlers.get(name)
+            if handler is None:
+                return _result_text(_err("unknown_tool", f"No tool named {name}"))
+
+            result = await _run_handler(name, handler, arguments)
 
-        if buf:
             duration_ms = round((time.monotonic() - t0) * 1000, 1)
+            error = result.get("error")
             buf.emit(
                 {
                     "event": "tool_call_end",
                     "tool": name,
                     "ok": result.get("ok"),
-                    "error_code": result.get("error", {}).get("code")
-                    if isinstance(result.get("error"), dict)
-                    else None,
+                    "error_code": error.get("code") if isinstance(error, dict) else None,
                     "duration_ms": duration_ms,
                     "connection_id": cid,
                 }
             )
 
-        return _result_text(result)
+            return _result_text(result)
 
-    init_trace()
     return server, state
 
 
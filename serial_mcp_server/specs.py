@@ -6,16 +6,20 @@ No serial imports — pure filesystem + YAML.
 
 from __future__ import annotations
 
+import copy
 import hashlib
+import heapq
 import json
 import logging
 import os
 import re
+import string
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 logger = logging.getLogger(__name__)
 
 SPEC_DIR_NAME = ".serial_mcp"
@@ -31,6 +35,24 @@ _FRONTMATTER_RE = re.compile(
     re.DOTALL,
 )
 
+# One ``key: value`` line of flat front matter whose meaning is unambiguous
+# without a YAML parser: the value is either double-quoted with no escapes or
+# a plain scalar starting with a letter (so never a number or timestamp).
+_FLAT_LINE_RE = re.compile(
+    r'([A-Za-z_][\w-]*) *: +(?:"([^"\\\x00-\x08\x0a-\x1f\x7f-\x9f\u2028\u2029]*)"|([A-Za-z][\w ./-]*?)) *'
+)
+# Plain scalars YAML resolves to bool/None rather than str (as keys too).
+_YAML_KEYWORDS = frozenset(
+    v for w in ("yes", "no", "true", "false", "on", "off", "null") for v in (w, w.capitalize(), w.upper())
+)
+# Characters PyYAML's reader rejects; such input must get YAML's error handling.
+_YAML_NON_PRINTABLE_RE = re.compile(
+    r"[^\x09\x0a\x0d\x20-\x7e\x85\xa0-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]"
+)
+
+# Runs of characters not allowed in a spec file slug.
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
 
 # ---------------------------------------------------------------------------
 # Directory resolution
@@ -49,9 +71,15 @@ def resolve_spec_root() -> Path:
     env = os.environ.get("SERIAL_MCP_SPEC_ROOT")
     if env:
         return Path(env)
+    return _walk_for_spec_root(Path.cwd())
 
-    cwd = Path.cwd()
 
+# The walk costs a stat per ancestor directory and is done for nearly every
+# spec call; its answer only changes if a nearer .serial_mcp/ or .git/ appears
+# later, so it is cached per working directory.
+@lru_cache(maxsize=8)
+def _walk_for_spec_root(cwd: Path) -> Path:
+    """Steps 2-4 of :func:`resolve_spec_root`, starting from *cwd*."""
     # Walk up looking for existing .serial_mcp/
     for parent in [cwd, *cwd.parents]:
         candidate = parent / SPEC_DIR_NAME
@@ -83,25 +111,51 @@ def _ensure_spec_dir(spec_root: Path) -> None:
 # ---------------------------------------------------------------------------
 
 
+# index.json path -> (st_mtime_ns, st_size, parsed index).  Callers get a
+# shallow copy; the entry dicts inside are shared and never mutated in place.
+_index_cache: dict[Path, tuple[int, int, dict[str, Any]]] = {}
+
+
 def _load_index(spec_root: Path) -> dict[str, Any]:
     """Load the index.json, returning empty dict if missing/corrupt."""
     index_path = spec_root / INDEX_FILE
-    if not index_path.exists():
+    try:
+        st = index_path.stat()
+    except OSError:
         return {}
+    cached = _index_cache.get(index_path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return dict(cached[2])
     try:
-        return json.loads(index_path.read_text(encoding="utf-8"))
+        index = json.loads(index_path.read_text(encoding="utf-8"))
     except (json.JSONDecodeError, OSError):
+        index = None
+    if not isinstance(index, dict):
         logger.warning("Corrupt index at %s, starting fresh", index_path)
         return {}
+    _index_cache[index_path] = (st.st_mtime_ns, st.st_size, index)
+    return dict(index)
 
 
 def _save_index(spec_root: Path, index: dict[str, Any]) -> None:
-    """Write the index.json."""
+    """Write the index.json.
+
+    Written to a temporary file and renamed over the index, so a crash
+    mid-write cannot leave a truncated index behind.
+    """
     index_path = spec_root / INDEX_FILE
-    index_path.write_text(
+    tmp_path = index_path.with_suffix(".json.tmp")
+    tmp_path.write_text(
         json.dumps(index, indent=2, default=str) + "\n",
         encoding="utf-8",
     )
+    os.replace(tmp_path, index_path)
+    try:
+        st = index_path.stat()
+    except OSError:
+        _index_cache.pop(index_path, None)
+    else:
+        _index_cache[index_path] = (st.st_mtime_ns, st.st_size, dict(index))
 
 
 # ---------------------------------------------------------------------------
@@ -122,6 +176,14 @@ def parse_frontmatter(content: str) -> tuple[dict[str, Any], str]:
     yaml_text = match.group(1)
     body = content[match.end() :]
 
+    meta = _parse_flat_frontmatter(yaml_text)
+    if meta is not None:
+        return meta, body
+
+    # Deferred: PyYAML costs ~13 ms to import and most sessions never parse
+    # a spec, while specs is imported at startup for resolve_spec_root.
+    import yaml
+
     try:
         meta = yaml.safe_load(yaml_text)
     except yaml.YAMLError:
@@ -133,6 +195,30 @@ def parse_frontmatter(content: str) -> tuple[dict[str, Any], str]:
     return meta, body
 
 
+def _parse_flat_frontmatter(text: str) -> dict[str, Any] | None:
+    """Parse front matter made only of simple ``key: value`` lines.
+
+    Covers what the spec template produces, giving the same dict
+    ``yaml.safe_load`` would.  Returns ``None`` for anything else, so the
+    caller falls back to PyYAML.
+    """
+    if _YAML_NON_PRINTABLE_RE.search(text):
+        return None
+    meta: dict[str, Any] = {}
+    for line in text.split("\n"):
+        line = line.rstrip("\r")
+        if not line.strip(" "):
+            continue
+        m = _FLAT_LINE_RE.fullmatch(line)
+        if m is None:
+            return None
+        key, quoted, plain = m.groups()
+        if key in _YAML_KEYWORDS or plain in _YAML_KEYWORDS:
+            return None
+        meta[key] = quoted if quoted is not None else plain
+    return meta or None
+
+
 def validate_spec_meta(meta: dict[str, Any]) -> list[str]:
     """Validate spec metadata. Returns a list of error strings (empty = valid).
 
@@ -148,6 +234,61 @@ def validate_spec_meta(meta: dict[str, Any]) -> list[str]:
     return errors
 
 
+@dataclass(frozen=True)
+class _ParsedSpec:
+    content: str
+    meta: dict[str, Any]
+    body: str
+    lines: tuple[str, ...]
+    # Lowercased lines joined by "\n", and the offset where each line starts in
+    # it -- lets search_spec find a term with str.find over the whole text.
+    lower_text: str
+    line_starts: tuple[int, ...]
+
+
+@lru_cache(maxsize=128)
+def _load_spec_cached(path: str, mtime_ns: int, size: int) -> _ParsedSpec:
+    """Read and parse a spec file.
+
+    Keyed on the file's mtime and size as well as its path, so an edited
+    file misses the cache and is parsed again.  The result is shared
+    between callers and must not be mutated.
+    """
+    content = Path(path).read_text(encoding="utf-8")
+    meta, body = parse_frontmatter(content)
+    lines = tuple(content.splitlines())
+    lowered = [line.lower() for line in lines]
+    line_starts: list[int] = []
+    pos = 0
+    for line in lowered:
+        line_starts.append(pos)
+        pos += len(line) + 1
+    return _ParsedSpec(
+        content=content,
+        meta=meta,
+        body=body,
+        lines=lines,
+        lower_text="\n".join(lowered),
+        line_starts=tuple(line_starts),
+    )
+
+
+def _lines_containing(parsed: _ParsedSpec, term: str) -> list[int]:
+    """0-based indices of the lines whose lowercased text contains *term*."""
+    text = parsed.lower_text
+    starts = parsed.line_starts
+    found: list[int] = []
+    pos = text.find(term)
+    while pos != -1:
+        idx = bisect_right(starts, pos) - 1
+        found.append(idx)
+        if idx + 1 >= len(starts):
+            break
+        # Skip the rest of this line: each line counts once per term.
+        pos = text.find(term, starts[idx + 1])
+    return found
+
+
 # ---------------------------------------------------------------------------
 # Spec ID
 # ---------------------------------------------------------------------------
@@ -158,8 +299,12 @@ def compute_spec_id(path: Path) -> str:
 
     Uses SHA-256 of the normalized absolute path, truncated to 16 hex chars.
     """
-    normalized = str(path.resolve())
-    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16]
+    return _spec_id_for_resolved(path.resolve())
+
+
+def _spec_id_for_resolved(resolved: Path) -> str:
+    """:func:`compute_spec_id` for a path that is already resolved."""
+    return hashlib.sha256(str(resolved).encode("utf-8")).hexdigest()[:16]
 
 
 # ---------------------------------------------------------------------------
@@ -167,13 +312,29 @@ def compute_spec_id(path: Path) -> str:
 # ---------------------------------------------------------------------------
 
 
-def _project_root() -> Path:
+def _project_root(spec_root: Path | None = None) -> Path:
     """Return the project root (parent of ``.serial_mcp/``)."""
-    spec_root = resolve_spec_root()
+    if spec_root is None:
+        spec_root = resolve_spec_root()
     # spec_root is .serial_mcp/, project root is its parent
     return spec_root.resolve().parent
 
 
+def _is_within(path: Path, root: Path) -> bool:
+    """True if resolved *path* is *root* or inside it.
+
+    Same answer as ``path == root or root in path.parents``, as one string
+    prefix test instead of building and comparing every parent ``Path``.
+    """
+    path_str = os.path.normcase(str(path))
+    root_str = os.path.normcase(str(root))
+    if path_str == root_str:
+        return True
+    if not root_str.endswith(os.sep):
+        root_str += os.sep
+    return path_str.startswith(root_str)
+
+
 def register_spec(path: str | Path) -> dict[str, Any]:
     """Register a spec file in the index.
 
@@ -185,22 +346,25 @@ def register_spec(path: str | Path) -> dict[str, Any]:
     """
     file_path = Path(path).resolve()
 
-    project = _project_root()
-    if project not in file_path.parents and file_path != project:
+    spec_root = resolve_spec_root()
+    project = _project_root(spec_root)
+    if not _is_within(file_path, project):
         raise ValueError(f"Spec path must be inside the project directory ({project}) — got {path}")
 
-    if not file_path.exists():
-        raise FileNotFoundError(f"Spec file not found: {file_path}")
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Spec file not found: {file_path}") from None
 
-    content = file_path.read_text(encoding="utf-8")
-    meta, _body = parse_frontmatter(content)
+    # Same (path, mtime, size) cache as read_spec: re-registering an unchanged
+    # file, or registering one that was just read, skips the read and parse.
+    meta = _load_spec_cached(str(file_path), st.st_mtime_ns, st.st_size).meta
 
     errors = validate_spec_meta(meta)
     if errors:
         raise ValueError(f"Invalid spec front-matter: {'; '.join(errors)}")
 
-    spec_id = compute_spec_id(file_path)
-    spec_root = resolve_spec_root()
+    spec_id = _spec_id_for_resolved(file_path)
     _ensure_spec_dir(spec_root)
 
     index = _load_index(spec_root)
@@ -223,8 +387,8 @@ def list_specs() -> list[dict[str, Any]]:
     return list(index.values())
 
 
-def read_spec(spec_id: str) -> dict[str, Any]:
-    """Read full spec content + path + metadata.
+def _read_spec_parsed(spec_id: str) -> tuple[Path, _ParsedSpec]:
+    """Resolve *spec_id* through the index and return its path and parsed file.
 
     Raises ``KeyError`` if the spec_id is not in the index.
     Raises ``FileNotFoundError`` if the file no longer exists.
@@ -238,22 +402,32 @@ def read_spec(spec_id: str) -> dict[str, Any]:
     entry = index[spec_id]
     file_path = Path(entry["path"]).resolve()
 
-    project = _project_root()
-    if project not in file_path.parents and file_path != project:
+    project = _project_root(spec_root)
+    if not _is_within(file_path, project):
         raise ValueError(f"Spec path in index points outside the project directory: {file_path}")
 
-    if not file_path.exists():
-        raise FileNotFoundError(f"Spec file missing: {file_path}")
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Spec file missing: {file_path}") from None
 
-    content = file_path.read_text(encoding="utf-8")
-    meta, body = parse_frontmatter(content)
+    return file_path, _load_spec_cached(str(file_path), st.st_mtime_ns, st.st_size)
+
+
+def read_spec(spec_id: str) -> dict[str, Any]:
+    """Read full spec content + path + metadata.
 
+    Raises ``KeyError`` if the spec_id is not in the index.
+    Raises ``FileNotFoundError`` if the file no longer exists.
+    """
+    file_path, parsed = _read_spec_parsed(spec_id)
     return {
         "spec_id": spec_id,
         "path": str(file_path),
-        "meta": meta,
-        "body": body,
-        "content": content,
+        # The cached meta is shared by every hit; callers get their own copy.
+        "meta": copy.deepcopy(parsed.meta),
+        "body": parsed.body,
+        "content": parsed.content,
     }
 
 
@@ -263,24 +437,29 @@ def search_spec(spec_id: str, query: str, k: int = 10) -> list[dict[str, Any]]:
     Returns up to *k* snippets with line numbers and context.
     Scoring: count of query terms found per line (case-insensitive).
     """
-    spec_data = read_spec(spec_id)
-    content = spec_data["content"]
-    lines = content.splitlines()
+    _path, parsed = _read_spec_parsed(spec_id)
+    lines = parsed.lines
 
     terms = query.lower().split()
     if not terms:
         return []
 
-    scored: list[tuple[int, int, str]] = []  # (score, line_num, line)
-    for i, line in enumerate(lines):
-        line_lower = line.lower()
-        score = sum(1 for term in terms if term in line_lower)
-        if score > 0:
-            scored.append((score, i + 1, line))
+    # Only lines that contain at least one term are visited, instead of
+    # testing every term against every line.
+    scores: dict[int, int] = {}
+    for term in terms:
+        for i in _lines_containing(parsed, term):
+            scores[i] = scores.get(i, 0) + 1
 
-    # Sort by score descending, then by line number ascending
-    scored.sort(key=lambda x: (-x[0], x[1]))
-    scored = scored[:k]
+    scored = [(score, i + 1, lines[i]) for i, score in scores.items()]  # (score, line_num, line)
+
+    # Score descending, then line number ascending.  Only the top k are
+    # ordered; a negative k keeps its slice meaning (all but the last -k).
+    if 0 <= k < len(scored):
+        scored = heapq.nsmallest(k, scored, key=lambda x: (-x[0], x[1]))
+    else:
+        scored.sort(key=lambda x: (-x[0], x[1]))
+        scored = scored[:k]
 
     results: list[dict[str, Any]] = []
     for score, line_num, line in scored:
@@ -308,7 +487,7 @@ def suggest_spec_path(device_name: str | None = None) -> Path:
     spec_root = resolve_spec_root()
     slug = "my-device"
     if device_name:
-        slug = re.sub(r"[^a-z0-9]+", "-", device_name.lower()).strip("-")
+        slug = _SLUG_RE.sub("-", device_name.lower()).strip("-")
     return spec_root / SPECS_SUBDIR / f"{slug}.md"
 
 
@@ -317,16 +496,13 @@ def suggest_spec_path(device_name: str | None = None) -> Path:
 # ---------------------------------------------------------------------------
 
 
-def get_template(device_name: str | None = None) -> str:
-    """Return a pre-filled markdown template for a new spec."""
-    name_line = f'name: "{device_name} Protocol"' if device_name else 'name: "My Device Protocol"'
-
-    return f"""---
+_SPEC_TEMPLATE = string.Template(
+    """---
 kind: serial-protocol
-{name_line}
+$name_line
 ---
 
-# {device_name or "My Device"} Serial Protocol
+# $device Serial Protocol
 
 ## Overview
 
@@ -389,3 +565,11 @@ Multi-step sequences that may involve multiple commands or timing requirements.
 
 Additional protocol notes, quirks, or implementation details.
 """
+)
+
+
+@lru_cache(maxsize=32)
+def get_template(device_name: str | None = None) -> str:
+    """Return a pre-filled markdown template for a new spec."""
+    name_line = f'name: "{device_name} Protocol"' if device_name else 'name: "My Device Protocol"'
+    return _SPEC_TEMPLATE.substitute(name_line=name_line, device=device_name or "My Device")
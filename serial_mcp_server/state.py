@@ -10,7 +10,7 @@ from typing import Any
 
 import serial as pyserial
 
-from serial_mcp_server.mirror import ReaderThread, SerialBuffer
+from serial_mcp_server.mirror import ReaderThread, SerialBuffer, WriterThread
 
 logger = logging.getLogger("serial_mcp_server")
 
@@ -37,9 +37,15 @@ class SerialConnection:
     ser: pyserial.Serial
     buffer: SerialBuffer = field(default_factory=SerialBuffer)
     reader: ReaderThread | None = None
+    writer: WriterThread | None = None
     opened_at: float = field(default_factory=time.time)
     last_seen_ts: float = field(default_factory=time.time)
     spec: dict[str, Any] | None = None
+    newline_bytes: bytes = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Encoded once: readline and append_newline use it on every call.
+        self.newline_bytes = self.newline.encode(self.encoding, errors="replace")
 
 
 # ---------------------------------------------------------------------------
@@ -58,6 +64,8 @@ class SerialState:
     def __init__(self, max_connections: int = 10) -> None:
         self.connections: dict[str, SerialConnection] = {}
         self.max_connections = max_connections
+        # port path -> connection_id of the most recent connection on that port.
+        self._port_index: dict[str, str] = {}
 
     def generate_id(self) -> str:
         return f"s{uuid.uuid4().hex[:8]}"
@@ -70,6 +78,11 @@ class SerialState:
             )
         return self.connections[connection_id]
 
+    def connection_for_port(self, port: str) -> SerialConnection | None:
+        """Return the most recently added connection on *port*, if any."""
+        connection_id = self._port_index.get(port)
+        return None if connection_id is None else self.connections.get(connection_id)
+
     def add_connection(self, conn: SerialConnection) -> None:
         if len(self.connections) >= self.max_connections:
             raise RuntimeError(
@@ -77,6 +90,7 @@ class SerialState:
                 "Close a connection first. Set SERIAL_MCP_MAX_CONNECTIONS to adjust."
             )
         self.connections[conn.connection_id] = conn
+        self._port_index[conn.port] = conn.connection_id
 
     def remove_connection(self, connection_id: str) -> SerialConnection:
         if connection_id not in self.connections:
@@ -84,12 +98,21 @@ class SerialState:
                 f"Unknown connection_id: {connection_id}. "
                 "Call serial.connections.list to see active connections."
             )
-        return self.connections.pop(connection_id)
+        conn = self.connections.pop(connection_id)
+        if self._port_index.get(conn.port) == connection_id:
+            del self._port_index[conn.port]
+        return conn
 
     def close_connection(self, connection_id: str) -> dict[str, Any]:
         """Close and remove a connection. Idempotent on already-closed ports."""
         conn = self.remove_connection(connection_id)
-        # Stop the background reader first (cleans up PTY if mirror is active).
+        # Let queued writes finish, then stop the background reader
+        # (cleans up PTY if mirror is active).
+        if conn.writer is not None:
+            try:
+                conn.writer.stop()
+            except Exception:
+                pass
         if conn.reader is not None:
             try:
                 conn.reader.stop()
@@ -105,6 +128,11 @@ class SerialState:
     async def shutdown(self) -> None:
         """Stop all readers and close all open serial ports."""
         for conn in list(self.connections.values()):
+            if conn.writer is not None:
+                try:
+                    conn.writer.stop()
+                except Exception:
+                    pass
             if conn.reader is not None:
                 try:
                     conn.reader.stop()
@@ -116,3 +144,4 @@ class SerialState:
             except Exception:
                 pass
         self.connections.clear()
+        self._port_index.clear()
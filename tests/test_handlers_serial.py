@@ -6,8 +6,10 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from serial_mcp_server import handlers_serial
 from serial_mcp_server.handlers_serial import (
     HANDLERS,
+    MAX_WRITE_BYTES,
     TOOLS,
     _format_data,
     handle_close,
@@ -24,6 +26,7 @@ from serial_mcp_server.handlers_serial import (
     handle_set_rts,
     handle_write,
 )
+from serial_mcp_server.mirror import WriterThread
 from serial_mcp_server.state import SerialState
 
 
@@ -38,6 +41,10 @@ class TestToolRegistration:
 
 
 class TestListPorts:
+    @pytest.fixture(autouse=True)
+    def _no_ports_cache(self, monkeypatch):
+        monkeypatch.setattr(handlers_serial, "_ports_cache", None)
+
     async def test_list_ports(self):
         state = SerialState()
         mock_port = MagicMock()
@@ -63,6 +70,50 @@ class TestListPorts:
         assert port["vid"] == "0x1234"
         assert port["pid"] == "0x5678"
 
+    async def test_list_ports_omits_unset_fields(self):
+        state = SerialState()
+        mock_port = MagicMock()
+        mock_port.device = "/dev/ttyS0"
+        mock_port.description = "n/a"
+        mock_port.hwid = "n/a"
+        mock_port.name = "ttyS0"
+        mock_port.vid = None
+        mock_port.pid = None
+        mock_port.serial_number = None
+        mock_port.manufacturer = None
+        mock_port.product = None
+        mock_port.location = None
+
+        with patch(
+            "serial_mcp_server.handlers_serial.serial.tools.list_ports.comports", return_value=[mock_port]
+        ):
+            result = await handle_list_ports(state, {})
+        assert result["ports"] == [
+            {"device": "/dev/ttyS0", "description": "n/a", "hwid": "n/a", "name": "ttyS0"}
+        ]
+
+    async def test_list_ports_reuses_recent_result(self):
+        state = SerialState()
+        with patch(
+            "serial_mcp_server.handlers_serial.serial.tools.list_ports.comports", return_value=[]
+        ) as comports:
+            await handle_list_ports(state, {})
+            await handle_list_ports(state, {})
+        comports.assert_called_once()
+
+    def test_list_ports_concurrent_on_separate_loops(self):
+        import asyncio
+
+        state = SerialState()
+
+        async def burst():
+            handlers_serial._ports_cache = None
+            return await asyncio.gather(*(handle_list_ports(state, {}) for _ in range(3)))
+
+        with patch("serial_mcp_server.handlers_serial.serial.tools.list_ports.comports", return_value=[]):
+            for _ in range(2):
+                assert all(r["ok"] for r in asyncio.run(burst()))
+
     async def test_list_ports_empty(self):
         state = SerialState()
         with patch("serial_mcp_server.handlers_serial.serial.tools.list_ports.comports", return_value=[]):
@@ -201,6 +252,16 @@ class TestRead:
         assert result["ok"]
         assert result["data"] == "AQID"
 
+    async def test_read_large_hex(self, connected_entry):
+        state, conn = connected_entry
+        payload = bytes(range(256)) * 80
+        conn.buffer.write(payload)
+        result = await handle_read(state, {"connection_id": "s1", "nbytes": 30000, "as": "hex"})
+        assert result["ok"]
+        assert result["n_read"] == len(payload)
+        assert result["data"] == payload.hex()
+        assert conn.buffer.available == 0
+
     async def test_read_empty_on_timeout(self, connected_entry):
         state, conn = connected_entry
         # Buffer is empty, should return empty after timeout
@@ -217,6 +278,14 @@ class TestWrite:
         assert result["ok"]
         assert result["bytes_written"] == 5
         conn.ser.write.assert_called_once_with(b"hello")
+        conn.ser.flush.assert_not_called()
+
+    async def test_write_wait_drain_flushes(self, connected_entry):
+        state, conn = connected_entry
+        conn.ser.write.return_value = 5
+        result = await handle_write(state, {"connection_id": "s1", "data": "hello", "wait_drain": True})
+        assert result["ok"]
+        conn.ser.flush.assert_called_once()
 
     async def test_write_hex(self, connected_entry):
         state, conn = connected_entry
@@ -231,6 +300,36 @@ class TestWrite:
         assert not result["ok"]
         assert result["error"]["code"] == "invalid_value"
 
+    async def test_write_uses_writer_thread(self, connected_entry):
+        state, conn = connected_entry
+        conn.ser.write.return_value = 5
+        conn.writer = WriterThread(conn.ser, conn.reader.write_lock)
+        conn.writer.start()
+        try:
+            result = await handle_write(state, {"connection_id": "s1", "data": "hello"})
+        finally:
+            conn.writer.stop()
+        assert result["ok"]
+        assert result["bytes_written"] == 5
+        conn.ser.write.assert_called_once_with(b"hello")
+
+    async def test_write_rejects_oversized_data_before_decoding(self, connected_entry):
+        state, conn = connected_entry
+        data = "00" * (MAX_WRITE_BYTES + 1) + " " * MAX_WRITE_BYTES
+        result = await handle_write(state, {"connection_id": "s1", "data": data, "as": "hex"})
+        assert not result["ok"]
+        assert result["error"]["code"] == "invalid_value"
+        conn.ser.write.assert_not_called()
+
+    async def test_write_rejects_oversized_decoded_payload(self, connected_entry):
+        state, conn = connected_entry
+        result = await handle_write(
+            state, {"connection_id": "s1", "data": "00" * (MAX_WRITE_BYTES + 1), "as": "hex"}
+        )
+        assert not result["ok"]
+        assert result["error"]["code"] == "invalid_value"
+        conn.ser.write.assert_not_called()
+
     async def test_write_append_newline(self, connected_entry):
         state, conn = connected_entry
         conn.ser.write.return_value = 6
@@ -308,12 +407,27 @@ class TestControlLines:
         assert result["duration_ms"] == 10
         assert conn.ser.rts is True
 
+    async def test_pulse_dtr_short(self, connected_entry):
+        state, conn = connected_entry
+        result = await handle_pulse_dtr(state, {"connection_id": "s1", "duration_ms": 1})
+        assert result["ok"]
+        assert result["duration_ms"] == 1
+        assert conn.ser.dtr is True
+
     async def test_pulse_dtr_clamped(self, connected_entry):
         state, _conn = connected_entry
         result = await handle_pulse_dtr(state, {"connection_id": "s1", "duration_ms": 999999})
         assert result["ok"]
         assert result["duration_ms"] == 10000
 
+    async def test_pulse_negative_duration(self, connected_entry):
+        state, conn = connected_entry
+        for handler, line in ((handle_pulse_dtr, "dtr"), (handle_pulse_rts, "rts")):
+            result = await handler(state, {"connection_id": "s1", "duration_ms": -1})
+            assert result["ok"]
+            assert result["duration_ms"] == 0
+            assert getattr(conn.ser, line) is True
+
 
 class TestOpenResourceCleanup:
     async def test_open_cleans_up_on_add_connection_failure(self):
@@ -350,3 +464,7 @@ class TestFormatData:
     def test_text_replace_errors(self):
         r = _format_data(b"\xff\xfe", "text", "utf-8")
         assert "\ufffd" in r["data"]
+
+    def test_unknown_format_falls_back_to_text(self):
+        r = _format_data(b"hi", "bogus", "utf-8")
+        assert r == {"data": "hi", "format": "text", "encoding": "utf-8"}
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 import sys
 import threading
@@ -13,6 +14,7 @@ import pytest
 from serial_mcp_server.mirror import (
     ReaderThread,
     SerialBuffer,
+    WriterThread,
     create_reader,
 )
 
@@ -28,6 +30,14 @@ if _IS_UNIX:
 
 
 class TestSerialBuffer:
+    def test_large_read_splits_buffer(self):
+        buf = SerialBuffer()
+        data = bytes(range(256)) * 200
+        buf.write(data)
+        assert buf.read(20000, timeout=0.01) == data[:20000]
+        buf.write(b"tail")
+        assert buf.read(len(data), timeout=0.01) == data[20000:] + b"tail"
+
     def test_write_and_read(self):
         buf = SerialBuffer()
         buf.write(b"hello")
@@ -43,6 +53,21 @@ class TestSerialBuffer:
         result2 = buf.read(100, timeout=0.01)
         assert result2 == b" world"
 
+    def test_readinto_copies_up_to_len(self):
+        buf = SerialBuffer()
+        buf.write(b"hello world")
+        out = bytearray(5)
+        assert buf.readinto(out, timeout=1.0) == 5
+        assert out == b"hello"
+        # Remainder stays in buffer
+        assert buf.read(100, timeout=0.01) == b" world"
+
+    def test_readinto_timeout_empty(self):
+        buf = SerialBuffer()
+        out = bytearray(4)
+        assert buf.readinto(out, timeout=0.01) == 0
+        assert out == bytes(4)
+
     def test_read_timeout_empty(self):
         buf = SerialBuffer()
         start = time.monotonic()
@@ -70,6 +95,34 @@ class TestSerialBuffer:
         result = buf.read_until(b"\r\n", max_bytes=100, timeout=1.0)
         assert result == b"line1\r\n"
 
+    def test_read_until_delimiter_split_across_writes(self):
+        buf = SerialBuffer()
+        buf.write(b"line1\r")
+
+        def delayed_write():
+            time.sleep(0.05)
+            buf.write(b"\nline2")
+
+        t = threading.Thread(target=delayed_write)
+        t.start()
+        result = buf.read_until(b"\r\n", max_bytes=100, timeout=1.0)
+        t.join()
+        assert result == b"line1\r\n"
+
+    def test_read_until_after_front_trimmed_while_waiting(self):
+        buf = SerialBuffer(max_size=8)
+        buf.write(b"abcdef")
+
+        def delayed_write():
+            time.sleep(0.05)
+            buf.write(b"g\nhij")  # overflows: drops "abc" from the front
+
+        t = threading.Thread(target=delayed_write)
+        t.start()
+        result = buf.read_until(b"\n", max_bytes=100, timeout=1.0)
+        t.join()
+        assert result == b"defg\n"
+
     def test_read_until_max_bytes(self):
         buf = SerialBuffer()
         buf.write(b"a very long line without newline")
@@ -181,6 +234,23 @@ class TestReaderThread:
         assert buf.available >= 5
         assert buf.read(5, timeout=0.01) == b"hello"
 
+    def test_burst_after_blocking_read_is_one_chunk(self):
+        buf = SerialBuffer()
+        ser = MagicMock()
+        waiting = iter([0, 4])
+        reads = iter([b"h", b"ello"])
+        type(ser).in_waiting = PropertyMock(side_effect=lambda: next(waiting, 0))
+        ser.read.side_effect = lambda n: next(reads, b"")
+
+        chunks: list[bytes] = []
+        reader = ReaderThread(ser, buf)
+        reader._on_data = chunks.append
+        reader.start()
+        time.sleep(0.1)
+        reader.stop()
+
+        assert chunks == [b"hello"]
+
     def test_start_stop(self):
         buf = SerialBuffer()
         ser = MagicMock()
@@ -207,6 +277,107 @@ class TestReaderThread:
         assert isinstance(reader.write_lock, type(threading.Lock()))
 
 
+# ---------------------------------------------------------------------------
+# WriterThread
+# ---------------------------------------------------------------------------
+
+
+class TestWriterThread:
+    async def test_submit_writes_under_lock(self):
+        ser = MagicMock()
+        lock = threading.Lock()
+
+        def write(payload):
+            assert lock.locked()
+            return len(payload)
+
+        ser.write.side_effect = write
+        writer = WriterThread(ser, lock)
+        writer.start()
+        try:
+            assert await writer.submit(b"hello") == 5
+        finally:
+            writer.stop()
+        ser.write.assert_called_once_with(b"hello")
+        ser.flush.assert_not_called()
+        assert not writer.alive
+
+    async def test_drain_flushes(self):
+        ser = MagicMock()
+        ser.write.side_effect = len
+        writer = WriterThread(ser, threading.Lock())
+        writer.start()
+        try:
+            assert await writer.submit(b"hello", drain=True) == 5
+        finally:
+            writer.stop()
+        ser.flush.assert_called_once()
+
+    async def test_coalesces_queued_writes(self):
+        ser = MagicMock()
+        ser.write.side_effect = len
+        writer = WriterThread(ser, threading.Lock())
+        # Queue before the thread starts so all three are pending at once.
+        futs = [writer.submit(b"ab"), writer.submit(b"c"), writer.submit(b"def")]
+        writer.start()
+        try:
+            assert [await f for f in futs] == [2, 1, 3]
+        finally:
+            writer.stop()
+        ser.write.assert_called_once_with(b"abcdef")
+
+    async def test_coalesced_short_write_split_in_order(self):
+        ser = MagicMock()
+        ser.write.return_value = 3
+        writer = WriterThread(ser, threading.Lock())
+        futs = [writer.submit(b"ab"), writer.submit(b"cd"), writer.submit(b"ef")]
+        writer.start()
+        try:
+            assert [await f for f in futs] == [2, 1, 0]
+        finally:
+            writer.stop()
+
+    async def test_write_error_propagates(self):
+        ser = MagicMock()
+        ser.write.side_effect = OSError("boom")
+        writer = WriterThread(ser, threading.Lock())
+        writer.start()
+        try:
+            with pytest.raises(OSError, match="boom"):
+                await writer.submit(b"x")
+        finally:
+            writer.stop()
+
+    async def test_stop_timeout_fails_pending_and_thread_exits(self, monkeypatch):
+        monkeypatch.setattr(WriterThread, "_STOP_TIMEOUT", 0.05)
+        release = threading.Event()
+        ser = MagicMock()
+        ser.write.side_effect = lambda data: release.wait(5) and len(data)
+        writer = WriterThread(ser, threading.Lock())
+        writer.start()
+        thread = writer._thread
+        busy = writer.submit(b"a" * WriterThread._COALESCE_BYTES)
+        while not ser.write.called:
+            await asyncio.sleep(0.001)
+        pending = writer.submit(b"b")
+
+        writer.stop()
+        with pytest.raises(RuntimeError, match="stopped"):
+            await pending
+
+        release.set()
+        assert await busy == WriterThread._COALESCE_BYTES
+        thread.join(timeout=2)
+        assert not thread.is_alive()
+
+    async def test_submit_after_stop_raises(self):
+        writer = WriterThread(MagicMock(), threading.Lock())
+        writer.start()
+        writer.stop()
+        with pytest.raises(RuntimeError):
+            writer.submit(b"x")
+
+
 # ---------------------------------------------------------------------------
 # MirrorSession (Unix only)
 # ---------------------------------------------------------------------------
@@ -226,6 +397,17 @@ class TestMirrorSession:
         finally:
             mirror.stop()
 
+    def test_pty_baud_follows_serial_port(self):
+        import termios
+
+        ser = MagicMock()
+        ser.baudrate = 9600
+        mirror = MirrorSession(ser, SerialBuffer(), mode="ro")
+        try:
+            assert termios.tcgetattr(mirror._slave_fd)[5] == termios.B9600
+        finally:
+            mirror.stop()
+
     def test_mirror_info(self):
         ser = MagicMock()
         ser.baudrate = 115200
@@ -254,6 +436,17 @@ class TestMirrorSession:
         # Symlink cleaned up on stop
         assert not os.path.exists(link)
 
+    def test_symlink_replaces_stale_link(self, tmp_path):
+        link = str(tmp_path / "testlink")
+        os.symlink(str(tmp_path / "gone"), link)  # dangling, as after a crash
+        ser = MagicMock()
+        ser.baudrate = 115200
+        mirror = MirrorSession(ser, SerialBuffer(), mode="ro", link_path=link)
+        try:
+            assert os.readlink(link) == mirror.pty_slave_path
+        finally:
+            mirror.stop()
+
     def test_data_to_buffer_and_pty(self):
         ser = MagicMock()
         ser.baudrate = 115200
@@ -275,6 +468,30 @@ class TestMirrorSession:
         # PTY fds are closed, no error expected
         assert not mirror.alive
 
+    def test_run_forwards_both_directions(self):
+        r, w = os.pipe()
+        ser = MagicMock()
+        ser.baudrate = 115200
+        ser.fileno.return_value = r
+        ser.in_waiting = 0
+        ser.read.side_effect = lambda n: os.read(r, 4096)
+        buf = SerialBuffer()
+        mirror = MirrorSession(ser, buf, mode="rw")
+        mirror.start()
+        try:
+            os.write(w, b"from device")
+            assert buf.read_until(b"device", 100, timeout=2.0) == b"from device"
+
+            os.write(mirror._slave_fd, b"from pty")
+            deadline = time.monotonic() + 2.0
+            while not ser.write.called and time.monotonic() < deadline:
+                time.sleep(0.01)
+            ser.write.assert_called_with(b"from pty")
+        finally:
+            mirror.stop()
+            os.close(r)
+            os.close(w)
+
 
 # ---------------------------------------------------------------------------
 # create_reader factory
@@ -145,6 +145,14 @@ class TestLoadPlugin:
         assert len(tools) == 1
         sys.modules.pop(module_key, None)
 
+    def test_accepts_tuple_tools(self, tmp_path: Path) -> None:
+        content = VALID_PLUGIN.replace("TOOLS = [", "TOOLS = (").replace("    ),\n]", "    ),\n)")
+        path = _write_plugin(tmp_path / "tup.py", content)
+        name, tools, handlers, module_key, meta = load_plugin(path)
+        assert isinstance(tools, list)
+        assert [t.name for t in tools] == ["test.hello"]
+        sys.modules.pop(module_key, None)
+
     def test_raises_on_missing_tools(self, tmp_path: Path) -> None:
         path = _write_plugin(tmp_path / "bad.py", "HANDLERS = {}")
         with pytest.raises(ValueError, match="TOOLS must be a list"):
@@ -170,6 +178,14 @@ HANDLERS = {"b": _h}
         with pytest.raises(ValueError, match="TOOLS/HANDLERS mismatch"):
             load_plugin(path)
 
+    def test_failed_validation_unregisters_module(self, tmp_path: Path) -> None:
+        # Tool entries without a .name fail inside validation with AttributeError.
+        path = _write_plugin(tmp_path / "broken.py", "TOOLS = [object()]\nHANDLERS = {}")
+        before = set(sys.modules)
+        with pytest.raises(AttributeError):
+            load_plugin(path)
+        assert not [k for k in set(sys.modules) - before if k.startswith("serial_mcp_plugin__broken__")]
+
     def test_unique_module_key(self, tmp_path: Path) -> None:
         p1 = _write_plugin(tmp_path / "dir1" / "hello.py", VALID_PLUGIN)
         p2 = _write_plugin(tmp_path / "dir2" / "hello.py", VALID_PLUGIN)
@@ -251,6 +267,19 @@ class TestPluginManager:
         assert "test.hello" in handlers
         assert "hello" in manager.loaded
 
+    def test_load_builds_list_payload(self, tmp_path: Path) -> None:
+        manager, _, _ = self._make_manager(tmp_path)
+        path = _write_plugin(manager.plugins_dir / "hello.py", VALID_PLUGIN)
+
+        info = manager.load(path)
+
+        assert info.payload == {
+            "name": "hello",
+            "path": str(path.resolve()),
+            "tools": ("test.hello",),
+            "meta": {},
+        }
+
     def test_load_raises_on_name_collision(self, tmp_path: Path) -> None:
         manager, tools, handlers = self._make_manager(tmp_path)
         # Plugin that tries to register "core.tool" which already exists
@@ -407,6 +436,29 @@ class TestPluginListHandler:
         assert result["plugins"] == []
         assert result["plugins_dir"] == str(plugins_dir)
 
+    @pytest.mark.asyncio
+    async def test_reflects_loads_after_previous_list(self, tmp_path: Path) -> None:
+        from serial_mcp_server.handlers_plugin import make_handlers
+
+        plugins_dir = tmp_path / "plugins"
+        plugins_dir.mkdir()
+        tools: list[Tool] = []
+        handlers: dict[str, Any] = {}
+        manager = PluginManager(plugins_dir, tools, handlers, enabled=True)
+        plugin_handlers = make_handlers(manager, None)  # type: ignore[arg-type]
+
+        result = await plugin_handlers["serial.plugin.list"](None, {})
+        assert result["count"] == 0
+
+        _write_plugin(plugins_dir / "hello.py", VALID_PLUGIN)
+        manager.load(plugins_dir / "hello.py")
+        result = await plugin_handlers["serial.plugin.list"](None, {})
+        assert result["count"] == 1
+
+        manager.unload("hello")
+        result = await plugin_handlers["serial.plugin.list"](None, {})
+        assert result["count"] == 0
+
 
 # ---------------------------------------------------------------------------
 # parse_plugin_policy
@@ -575,6 +627,16 @@ class TestPluginHandlers:
         assert "SensorTag" in result["template"] or "sensortag" in result["template"]
         assert "sensortag" in result["suggested_path"]
 
+    def test_make_handlers_does_not_outlive_manager(self, tmp_path: Path) -> None:
+        import gc
+        import weakref
+
+        _plugin_handlers, manager = self._setup(tmp_path)
+        manager_ref = weakref.ref(manager)
+        del manager, _plugin_handlers
+        gc.collect()
+        assert manager_ref() is None
+
     @pytest.mark.asyncio
     async def test_reload_success(self, tmp_path: Path) -> None:
         plugin_handlers, manager = self._setup(tmp_path)
@@ -588,6 +650,29 @@ class TestPluginHandlers:
         assert result["name"] == "hello"
         assert "test.hello" in result["tools"]
 
+    @pytest.mark.asyncio
+    async def test_reload_unchanged_skips_notification(self, tmp_path: Path) -> None:
+        plugin_handlers, manager = self._setup(tmp_path)
+        path = _write_plugin(manager.plugins_dir / "hello.py", VALID_PLUGIN)
+        manager.load(path)
+
+        result = await plugin_handlers["serial.plugin.reload"](None, {"name": "hello"})
+        assert result["ok"] is True
+        assert result["changed"] is False
+        assert result["notified"] is False
+
+    @pytest.mark.asyncio
+    async def test_reload_changed_notifies(self, tmp_path: Path) -> None:
+        plugin_handlers, manager = self._setup(tmp_path)
+        path = _write_plugin(manager.plugins_dir / "hello.py", VALID_PLUGIN)
+        manager.load(path)
+        _write_plugin(path, VALID_PLUGIN_V2)
+
+        result = await plugin_handlers["serial.plugin.reload"](None, {"name": "hello"})
+        assert result["ok"] is True
+        assert result["changed"] is True
+        assert result["notified"] is True
+
     @pytest.mark.asyncio
     async def test_reload_unknown_plugin(self, tmp_path: Path) -> None:
         plugin_handlers, manager = self._setup(tmp_path)
@@ -625,6 +710,50 @@ class TestPluginHandlers:
         assert result["ok"] is False
         assert result["error"]["code"] == "invalid_params"
 
+    @pytest.mark.asyncio
+    async def test_load_whitespace_path(self, tmp_path: Path) -> None:
+        plugin_handlers, manager = self._setup(tmp_path)
+
+        result = await plugin_handlers["serial.plugin.load"](None, {"path": "   "})
+        assert result["ok"] is False
+        assert result["error"]["code"] == "invalid_params"
+
+    @pytest.mark.asyncio
+    async def test_load_path_is_not_stripped(self, tmp_path: Path) -> None:
+        plugin_handlers, manager = self._setup(tmp_path)
+        path = _write_plugin(manager.plugins_dir / "hello.py", VALID_PLUGIN)
+
+        result = await plugin_handlers["serial.plugin.load"](None, {"path": f"{path} "})
+        assert result["ok"] is False
+        assert result["error"]["code"] == "plugin_error"
+        assert "hello" not in manager.loaded
+
+    @pytest.mark.asyncio
+    async def test_load_missing_file(self, tmp_path: Path) -> None:
+        plugin_handlers, manager = self._setup(tmp_path)
+
+        result = await plugin_handlers["serial.plugin.load"](
+            None, {"path": str(manager.plugins_dir / "nope.py")}
+        )
+        assert result["ok"] is False
+        assert result["error"]["code"] == "plugin_error"
+
+    @pytest.mark.asyncio
+    async def test_load_key_error_is_plugin_error(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        plugin_handlers, manager = self._setup(tmp_path)
+
+        def boom(_path: Path) -> None:
+            raise KeyError("missing")
+
+        monkeypatch.setattr(manager, "load", boom)
+        result = await plugin_handlers["serial.plugin.load"](
+            None, {"path": str(manager.plugins_dir / "x.py")}
+        )
+        assert result["ok"] is False
+        assert result["error"]["code"] == "plugin_error"
+
     @pytest.mark.asyncio
     async def test_load_path_traversal_blocked(self, tmp_path: Path) -> None:
         plugin_handlers, manager = self._setup(tmp_path)
@@ -677,3 +806,36 @@ class TestPluginHandlers:
         assert result["ok"] is True
         assert result["enabled"] is True
         assert result["policy"] == "alpha,beta"
+
+
+# ---------------------------------------------------------------------------
+# Example demo-device plugin
+# ---------------------------------------------------------------------------
+
+DEMO_PLUGIN = Path(__file__).resolve().parent.parent / "examples" / "demo-device" / "demo_device_plugin.py"
+
+
+class TestDemoDevicePlugin:
+    @pytest.fixture
+    def batch(self):
+        name, tools, handlers, module_key, meta = load_plugin(DEMO_PLUGIN)
+        yield handlers["demo.batch"]
+        sys.modules.pop(module_key, None)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "commands",
+        [
+            "status",
+            [1],
+            ["version\nreboot"],
+            ["version", "sample 3 100"],
+            ["REBOOT"],
+        ],
+    )
+    async def test_batch_rejects_before_writing(self, batch, commands) -> None:
+        state = MagicMock()
+        result = await batch(state, {"connection_id": "s1", "commands": commands})
+        assert result["ok"] is False
+        assert result["error"]["code"] == "invalid_params"
+        state.get_connection.assert_not_called()
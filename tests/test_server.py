@@ -25,6 +25,25 @@ class TestResultFormat:
         parsed = json.loads(texts[0].text)
         assert parsed == payload
 
+    def test_result_text_matches_stdlib_json(self, monkeypatch):
+        from dataclasses import dataclass
+        from pathlib import Path
+
+        from serial_mcp_server import helpers
+
+        @dataclass
+        class Point:
+            x: int
+
+        payloads = [
+            {"ok": True, "raw": b"\x01", "path": Path("/tmp/x"), "pt": Point(1), 3: None},
+            {"ok": True, "big": 2**70},
+        ]
+        texts = [_result_text(p)[0].text for p in payloads]
+        monkeypatch.setattr(helpers, "orjson", None)
+        for payload, text in zip(payloads, texts, strict=True):
+            assert json.loads(text) == json.loads(_result_text(payload)[0].text)
+
 
 # ---------------------------------------------------------------------------
 # build_server wiring
@@ -39,3 +58,44 @@ class TestBuildServer:
         assert server is not None
         assert state is not None
         assert hasattr(state, "connections")
+
+
+async def _call(server, name: str, arguments: dict) -> dict:
+    from mcp.types import CallToolRequest, CallToolRequestParams
+
+    req = CallToolRequest(method="tools/call", params=CallToolRequestParams(name=name, arguments=arguments))
+    res = await server.request_handlers[CallToolRequest](req)
+    return json.loads(res.root.content[0].text)
+
+
+class TestCallToolTracing:
+    async def test_untraced_dispatch(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("SERIAL_MCP_SPEC_ROOT", str(tmp_path / ".serial_mcp"))
+        monkeypatch.setattr("serial_mcp_server.trace.TRACE_ENABLED", False)
+        monkeypatch.setattr("serial_mcp_server.trace._buffer", None)
+        from serial_mcp_server.server import build_server
+
+        server, _state = build_server()
+        result = await _call(server, "serial.connections.list", {})
+        assert result["ok"] is True
+        assert result["count"] == 0
+
+    async def test_traced_dispatch_emits_events(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("SERIAL_MCP_SPEC_ROOT", str(tmp_path / ".serial_mcp"))
+        monkeypatch.setattr("serial_mcp_server.trace.TRACE_ENABLED", True)
+        monkeypatch.setattr("serial_mcp_server.trace._buffer", None)
+        from serial_mcp_server.server import build_server
+        from serial_mcp_server.trace import get_trace_buffer
+
+        server, _state = build_server()
+        buf = get_trace_buffer()
+        try:
+            result = await _call(server, "serial.read", {"connection_id": "nope"})
+            assert result["error"]["code"] == "not_found"
+            events = buf.tail(2)
+            assert [e["event"] for e in events] == ["tool_call_start", "tool_call_end"]
+            assert events[1]["error_code"] == "not_found"
+            assert events[1]["connection_id"] == "nope"
+        finally:
+            buf.close()
+            monkeypatch.setattr("serial_mcp_server.trace._buffer", None)
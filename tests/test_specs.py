@@ -108,6 +108,21 @@ class TestResolveSpecRoot:
         result = resolve_spec_root()
         assert result == tmp_path / ".serial_mcp"
 
+    def test_walk_is_cached_per_cwd(self, monkeypatch, tmp_path):
+        from serial_mcp_server import specs
+
+        monkeypatch.delenv("SERIAL_MCP_SPEC_ROOT", raising=False)
+        (tmp_path / ".git").mkdir()
+        child = tmp_path / "sub"
+        child.mkdir()
+        monkeypatch.chdir(child)
+        assert resolve_spec_root() == tmp_path / ".serial_mcp"
+
+        (child / ".serial_mcp").mkdir()
+        assert resolve_spec_root() == tmp_path / ".serial_mcp"
+        specs._walk_for_spec_root.cache_clear()
+        assert resolve_spec_root() == child / ".serial_mcp"
+
 
 # ---------------------------------------------------------------------------
 # Frontmatter parsing
@@ -139,6 +154,19 @@ class TestParseFrontmatter:
         assert meta == {}
         assert body == content
 
+    def test_flat_frontmatter_skips_yaml(self, monkeypatch):
+        import sys
+
+        monkeypatch.setitem(sys.modules, "yaml", None)  # any `import yaml` now fails
+        meta, body = parse_frontmatter(get_template("Sensor v2.1"))
+        assert meta == {"kind": "serial-protocol", "name": "Sensor v2.1 Protocol"}
+        assert "# Sensor v2.1 Serial Protocol" in body
+
+    def test_typed_scalars_still_use_yaml(self):
+        content = '---\nkind: serial-protocol\nname: "X"\nversion: 1.0\nenabled: yes\n---\nBody\n'
+        meta, _body = parse_frontmatter(content)
+        assert meta == {"kind": "serial-protocol", "name": "X", "version": 1.0, "enabled": True}
+
 
 # ---------------------------------------------------------------------------
 # Validation
@@ -197,6 +225,27 @@ class TestRegisterSpec:
         with pytest.raises(ValueError, match="Invalid spec front-matter"):
             register_spec(spec_file)
 
+    def test_reregister_unchanged_file_is_not_reparsed(self, monkeypatch, tmp_path):
+        from serial_mcp_server import specs
+
+        _setup_env(monkeypatch, tmp_path)
+        spec_file = _write_spec(tmp_path, VALID_SPEC)
+        calls = []
+        real_parse = specs.parse_frontmatter
+        monkeypatch.setattr(specs, "parse_frontmatter", lambda c: calls.append(c) or real_parse(c))
+        specs._load_spec_cached.cache_clear()
+
+        entry = register_spec(spec_file)
+        assert register_spec(spec_file) == entry
+        read_spec(entry["spec_id"])
+        assert len(calls) == 1
+
+    def test_index_written_atomically(self, monkeypatch, tmp_path):
+        spec_root = _setup_env(monkeypatch, tmp_path)
+        register_spec(_write_spec(tmp_path, VALID_SPEC))
+        assert (spec_root / "index.json").is_file()
+        assert not (spec_root / "index.json.tmp").exists()
+
     def test_idempotent(self, monkeypatch, tmp_path):
         _setup_env(monkeypatch, tmp_path)
         spec_file = _write_spec(tmp_path, VALID_SPEC)
@@ -236,6 +285,27 @@ class TestRegisterSpec:
 
 
 class TestListSpecs:
+    def test_index_reread_only_when_changed(self, monkeypatch, tmp_path):
+        import json
+        import os
+
+        spec_root = _setup_env(monkeypatch, tmp_path)
+        register_spec(_write_spec(tmp_path, VALID_SPEC))
+        reads = []
+        real_loads = json.loads
+        monkeypatch.setattr(json, "loads", lambda s: reads.append(s) or real_loads(s))
+
+        assert len(list_specs()) == 1
+        assert len(list_specs()) == 1
+        assert reads == []  # served from the copy cached by _save_index
+
+        index_path = spec_root / "index.json"
+        index_path.write_text("{}", encoding="utf-8")
+        st = index_path.stat()
+        os.utime(index_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert list_specs() == []
+        assert len(reads) == 1
+
     def test_empty(self, monkeypatch, tmp_path):
         _setup_env(monkeypatch, tmp_path)
         assert list_specs() == []
@@ -278,6 +348,20 @@ class TestReadSpec:
         assert "# Test Device Protocol" in result["body"]
         assert result["content"] == VALID_SPEC
 
+    def test_mutating_meta_does_not_affect_cache(self, monkeypatch, tmp_path):
+        _setup_env(monkeypatch, tmp_path)
+        spec_file = _write_spec(tmp_path, VALID_SPEC)
+        entry = register_spec(spec_file)
+
+        first = read_spec(entry["spec_id"])
+        first["meta"]["name"] = "Tampered"
+        first["meta"]["extra"] = 1
+
+        again = read_spec(entry["spec_id"])
+        assert again["meta"]["name"] == "Test Device"
+        assert "extra" not in again["meta"]
+        assert register_spec(spec_file)["name"] == "Test Device"
+
     def test_unknown_id(self, monkeypatch, tmp_path):
         _setup_env(monkeypatch, tmp_path)
         with pytest.raises(KeyError):
@@ -300,6 +384,34 @@ class TestReadSpec:
         with pytest.raises(ValueError, match="outside the project"):
             read_spec("bad")
 
+    def test_unchanged_file_is_not_reparsed(self, monkeypatch, tmp_path):
+        from serial_mcp_server import specs
+
+        _setup_env(monkeypatch, tmp_path)
+        spec_file = _write_spec(tmp_path, VALID_SPEC)
+        entry = register_spec(spec_file)
+        calls = []
+        real_parse = specs.parse_frontmatter
+        monkeypatch.setattr(specs, "parse_frontmatter", lambda c: calls.append(c) or real_parse(c))
+        specs._load_spec_cached.cache_clear()
+
+        read_spec(entry["spec_id"])
+        read_spec(entry["spec_id"])
+        assert len(calls) == 1
+
+    def test_edited_file_is_reparsed(self, monkeypatch, tmp_path):
+        import os
+
+        _setup_env(monkeypatch, tmp_path)
+        spec_file = _write_spec(tmp_path, VALID_SPEC)
+        entry = register_spec(spec_file)
+        assert read_spec(entry["spec_id"])["meta"]["name"] == "Test Device"
+
+        spec_file.write_text(VALID_SPEC.replace("Test Device", "Other Device"), encoding="utf-8")
+        st = spec_file.stat()
+        os.utime(spec_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert read_spec(entry["spec_id"])["meta"]["name"] == "Other Device"
+
 
 # ---------------------------------------------------------------------------
 # Search
@@ -336,6 +448,15 @@ class TestSearchSpec:
         results = search_spec(entry["spec_id"], "a", k=2)
         assert len(results) <= 2
 
+    def test_k_limit_keeps_ranking(self, monkeypatch, tmp_path):
+        _setup_env(monkeypatch, tmp_path)
+        spec_file = _write_spec(tmp_path, VALID_SPEC)
+        entry = register_spec(spec_file)
+
+        everything = search_spec(entry["spec_id"], "e r", k=100)
+        assert len(everything) > 3
+        assert search_spec(entry["spec_id"], "e r", k=3) == everything[:3]
+
     def test_context(self, monkeypatch, tmp_path):
         _setup_env(monkeypatch, tmp_path)
         spec_file = _write_spec(tmp_path, VALID_SPEC)
@@ -347,6 +468,17 @@ class TestSearchSpec:
         # Context should contain line numbers
         assert ":" in results[0]["context"]
 
+    def test_substring_scoring(self, monkeypatch, tmp_path):
+        _setup_env(monkeypatch, tmp_path)
+        spec_file = _write_spec(tmp_path, VALID_SPEC)
+        entry = register_spec(spec_file)
+
+        # Terms match as case-insensitive substrings; each term counts once per line.
+        results = search_spec(entry["spec_id"], "READ sens 0x0")
+        assert results[0]["text"] == "### Read Sensor"
+        assert results[0]["score"] == 2
+        assert [r["text"] for r in results if r["score"] == 1] == ["- **Format**: `[0x01]`"]
+
 
 # ---------------------------------------------------------------------------
 # Update
@@ -92,6 +92,27 @@ class TestSerialState:
         assert removed is conn
         assert "s1" not in state.connections
 
+    def test_connection_for_port(self):
+        state = SerialState()
+        conn = SerialConnection(
+            connection_id="s1",
+            port="/dev/ttyUSB0",
+            baudrate=115200,
+            bytesize=8,
+            parity="N",
+            stopbits=1,
+            timeout=0.2,
+            write_timeout=0.2,
+            encoding="utf-8",
+            newline="\n",
+            ser=MagicMock(),
+        )
+        state.add_connection(conn)
+        assert state.connection_for_port("/dev/ttyUSB0") is conn
+        assert state.connection_for_port("/dev/ttyUSB1") is None
+        state.remove_connection("s1")
+        assert state.connection_for_port("/dev/ttyUSB0") is None
+
     def test_remove_connection_missing_raises(self):
         state = SerialState()
         with pytest.raises(KeyError, match="Unknown connection_id"):
@@ -164,3 +185,19 @@ class TestSerialConnection:
         )
         assert conn.opened_at > 0
         assert conn.last_seen_ts > 0
+
+    def test_newline_bytes_encoded_once(self):
+        conn = SerialConnection(
+            connection_id="s1",
+            port="/dev/ttyUSB0",
+            baudrate=115200,
+            bytesize=8,
+            parity="N",
+            stopbits=1,
+            timeout=0.2,
+            write_timeout=0.2,
+            encoding="utf-8",
+            newline="\r\n",
+            ser=MagicMock(),
+        )
+        assert conn.newline_bytes == b"\r\n"